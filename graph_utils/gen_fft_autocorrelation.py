@@ -0,0 +1,103 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+#---------------------------------------
+
+def gen_fft_autocorrelation(series, max_lag: int = None) -> np.ndarray:
+
+    """
+    Description:
+
+    This function computes the sample autocorrelations of a series for lags 0, 1, ..., max_lag (Law
+    p.250),
+
+        r_k = sum_{t=1}^{N-k} (x_t - x_bar)(x_{t+k} - x_bar) / sum_{t=1}^{N} (x_t - x_bar)^2
+
+    Computing every lag directly takes O(N^2) operations, which is too slow for series with millions of
+    timesteps. Instead the autocovariances are all found at once from the inverse FFT of the power
+    spectrum of the centered series, zero padded to at least 2N points so the circular correlation the
+    FFT computes equals the linear one. This takes O(N log N) operations.
+
+    If series is two dimensional, each row is treated as a separate series (e.g., one replication of a
+    simulation after deleting the warmup period). Each row is centered on its own mean, and the lag
+    products and squared deviations are summed over all rows before dividing, giving a single pooled
+    autocorrelation estimate. Rows are transformed a block at a time, so the FFT working memory stays at a
+    few blocks of at most 4194304 padded values however many rows there are.
+
+    Inputs:
+
+        series (list or NumPy array) = The series (one dimensional) or series (two dimensional, one per
+                                       row). Must be fully populated with finite values and have at least 2
+                                       values per row.
+
+        max_lag (int) = (Optional) The largest lag to compute. Must be between 0 and the row length - 1.
+                        Defaults to the row length - 1.
+
+    Outputs:
+
+        acf (NumPy array) = The autocorrelations for lags 0, 1, ..., max_lag (acf[0] is 1.0). If every
+                            value is constant, the autocorrelations are undefined and NaN is returned for
+                            every lag.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_fft_autocorrelation.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Confirm User Inputs -----------------------
+    # series needs to be one or two dimensional
+    wrk_arr = np.asarray(series, dtype = 'float64')
+    if not (wrk_arr.ndim == 1 or wrk_arr.ndim == 2):
+        raise Exception('series needs to be one or two dimensional')
+
+    # Work with one series per row
+    if wrk_arr.ndim == 1:
+        wrk_arr = wrk_arr.reshape(1, -1)
+
+    # series needs at least 2 values per row
+    if not wrk_arr.shape[1] >= 2:
+        raise Exception('series needs to have at least 2 values per row')
+
+    # series needs to be fully populated
+    if not np.isfinite(wrk_arr).all():
+        raise Exception('series needs to be fully populated with finite values')
+
+    # If provided, max_lag needs to be an int between 0 and the row length - 1
+    if not max_lag == None:
+        if not (isinstance(max_lag,int) and 0 <= max_lag < wrk_arr.shape[1]):
+            raise Exception('max_lag needs to be an int between 0 and the number of values per row - 1')
+    #------------------ End Confirm User Inputs -------------------
+
+    n_obs = wrk_arr.shape[1]
+    if max_lag == None:
+        max_lag = n_obs - 1
+
+    # Zero pad to a fast FFT length of at least 2N so there is no wraparound
+    n_fft = 1 << int(2 * n_obs - 1).bit_length()
+
+    # Autocovariance sums for every lag from the inverse FFT of the power spectrum, summed over rows. Rows
+    # are transformed in blocks of at most 4194304 padded values, so memory is O(block rows x n_fft)
+    # rather than O(rows x n_fft).
+    block_rows = max(1, 4194304 // n_fft)
+    lag_sums = np.zeros(max_lag + 1)
+    for start in range(0, wrk_arr.shape[0], block_rows):
+
+        # Center each row on its own mean
+        block_arr = wrk_arr[start:start + block_rows]
+        centered = block_arr - block_arr.mean(axis = 1, keepdims = True)
+
+        spec = np.fft.rfft(centered, n = n_fft, axis = 1)
+        lag_sums += np.fft.irfft((spec * np.conj(spec)).real, n = n_fft, axis = 1)[:, :max_lag + 1].sum(axis = 0)
+
+    # Undefined for a constant series
+    if not lag_sums[0] > 0.0:
+        return np.full(max_lag + 1, np.nan)
+
+    return lag_sums / lag_sums[0]
@@ -0,0 +1,88 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+#---------------------------------------
+
+def gen_lttb_downsample(x, y, n_out: int) -> np.ndarray:
+
+    """
+    Description:
+
+    This function picks which points of a long line series to plot using the Largest-Triangle-Three-
+    Buckets (LTTB) algorithm (Steinarsson, "Downsampling Time Series for Visual Representation", 2013).
+    The first and last points are always kept. The remaining points are split into n_out - 2 buckets of
+    consecutive points, and from each bucket the point forming the largest triangle with the point kept
+    from the previous bucket and the average point of the next bucket is kept. This preserves the peaks,
+    troughs and overall shape of the series far better than taking every k-th point.
+
+    The function returns the indices of the kept points rather than the points themselves, so the same
+    selection can be applied to other series sharing the x values (e.g., confidence band bounds).
+
+    Inputs:
+
+        x (list or NumPy array) = x coordinates of the series, in increasing order.
+
+        y (list or NumPy array) = y coordinates of the series, the same length as x.
+
+        n_out (int) = The number of points to keep. Must be at least 3.
+
+    Outputs:
+
+        idx (NumPy array) = Increasing int indices of the points to keep. If the series has n_out points
+                            or fewer, every index is returned.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_lttb_downsample.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Confirm User Inputs -----------------------
+    # n_out needs to be an int of at least 3
+    if not (isinstance(n_out,int) and n_out >= 3):
+        raise Exception('n_out needs to be an int of at least 3')
+
+    # x and y need to be one dimensional and the same length
+    wrk_x = np.asarray(x, dtype = 'float64')
+    wrk_y = np.asarray(y, dtype = 'float64')
+    if not (wrk_x.ndim == 1 and wrk_y.ndim == 1 and len(wrk_x) == len(wrk_y)):
+        raise Exception('x and y need to be one dimensional and the same length')
+    #------------------ End Confirm User Inputs -------------------
+
+    n = len(wrk_x)
+    if n <= n_out:
+        return np.arange(n)
+
+    # Bucket edges for the interior points 1, ..., n-2
+    edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype('int64')
+
+    # Average point of each bucket (the last point stands in for the bucket after the last one)
+    cum_x = np.concatenate(([0.0], np.cumsum(wrk_x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(wrk_y)))
+    bucket_len = edges[1:] - edges[:-1]
+    avg_x = np.append((cum_x[edges[1:]] - cum_x[edges[:-1]]) / bucket_len, wrk_x[-1])
+    avg_y = np.append((cum_y[edges[1:]] - cum_y[edges[:-1]]) / bucket_len, wrk_y[-1])
+
+    idx = np.empty(n_out, dtype = 'int64')
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    # Each bucket depends on the point kept from the previous one, so buckets are visited in order
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+
+        # Twice the triangle area for every candidate in the bucket
+        area = np.abs(((wrk_x[prev] - avg_x[i + 1]) * (wrk_y[lo:hi] - wrk_y[prev])) -
+                      ((wrk_x[prev] - wrk_x[lo:hi]) * (avg_y[i + 1] - wrk_y[prev])))
+
+        prev = lo + int(np.argmax(area))
+        idx[i + 1] = prev
+
+    return idx
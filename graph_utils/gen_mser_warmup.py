@@ -0,0 +1,86 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+#---------------------------------------
+
+def gen_mser_warmup(timestep_means, batch_size: int = 5) -> int:
+
+    """
+    Description:
+
+    This function estimates the length of a warmup period (l) with the MSER-m truncation rule (MSER-5
+    with the default batch_size of 5). It is meant to be run on the timestep means produced by Welch's
+    procedure (see gen_welch_procedure_plots) so warmup selection can run without a person reading the
+    moving-average plot.
+
+    The series is split into k = floor(m / batch_size) non-overlapping batches and the batch means
+    Z_1, ..., Z_k are computed (timesteps past the last full batch are dropped). For each candidate
+    number of deleted batches d, the MSER statistic is
+
+        MSER(d) = sum_{j=d+1}^{k} (Z_j - Zbar(d))^2 / (k - d)^2
+
+    where Zbar(d) is the mean of the batch means that are kept. All MSER(d) values come from prefix sums
+    of Z and Z^2, so the function is O(m). The suggested warmup is l = d* x batch_size timesteps, where d*
+    minimizes MSER(d) over d < k/2 (truncating more than half of the series is not considered, since the
+    statistic becomes unreliable when few batches remain).
+
+    Inputs:
+
+        timestep_means (list or NumPy array) = Int or float values ordered by timestep (index 0 is
+                                               timestep 1), e.g., WelchResult.timestep_means.
+
+        batch_size (int) = (Optional) Number of timesteps per batch. Defaults to 5 (MSER-5).
+
+    Outputs:
+
+        l (int) = The suggested number of warmup timesteps to delete. 0 when the series has fewer than
+                  two full batches.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_mser_warmup.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Confirm User Inputs -----------------------
+    # batch_size needs to be a positive int
+    if not (isinstance(batch_size,int) and batch_size > 0):
+        raise Exception('batch_size needs to be a positive int')
+
+    # timestep_means needs to be a one dimensional sequence of finite numbers
+    try:
+        wrk_means = np.asarray(timestep_means, dtype = 'float64')
+    except (TypeError, ValueError):
+        raise Exception('timestep_means needs to hold int or float values')
+    if not wrk_means.ndim == 1:
+        raise Exception('timestep_means needs to be one dimensional')
+    if not np.isfinite(wrk_means).all():
+        raise Exception('timestep_means needs to be fully populated with finite values')
+    #------------------ End Confirm User Inputs -------------------
+
+    # Number of full batches
+    k = len(wrk_means) // batch_size
+    if k < 2:
+        return 0
+
+    # Batch means
+    batch_means = wrk_means[:k * batch_size].reshape(k, batch_size).mean(axis = 1)
+
+    # Sums of the kept batch means (and their squares) for every d, from suffix totals of prefix sums
+    cum_z = np.concatenate(([0.0], np.cumsum(batch_means)))
+    cum_z_sq = np.concatenate(([0.0], np.cumsum(batch_means ** 2)))
+    d = np.arange(0, (k + 1) // 2)
+    kept = (k - d).astype('float64')
+    kept_sum = cum_z[k] - cum_z[d]
+    kept_sum_sq = cum_z_sq[k] - cum_z_sq[d]
+
+    # MSER(d); rounding can leave tiny negative sums of squares, which are clipped to 0
+    mser = np.maximum(kept_sum_sq - ((kept_sum ** 2) / kept), 0.0) / (kept ** 2)
+
+    return int(np.argmin(mser)) * batch_size
@@ -0,0 +1,122 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+from scipy.stats import t
+#---------------------------------------
+
+def gen_replication_deletion_ci(rep_matrix, warmup_l, approx_confidence_level_pct: float = 95.0):
+
+    """
+    Description:
+
+    This function computes the replication/deletion confidence interval for a steady-state mean, the
+    approach to steady-state analysis presented in "Simulation Modeling and Analysis: 6th Edition" by
+    Averill M. Law that follows choosing a warmup length with Welch's procedure. For a warmup length l,
+    the first l timesteps of every replication are deleted and the mean of the remaining m - l timesteps
+    of replication j is X_j(l). The X_j(l) are IID across replications, so the interval is
+
+        X_bar(l) -/+ t_{n-1, 1-alpha/2} * sqrt(S^2(l) / n)
+
+    where X_bar(l) and S^2(l) are the sample mean and variance of X_1(l), ..., X_n(l).
+
+    The input is the n x m matrix of metric values built for Welch's procedure (one row per replication,
+    one column per timestep; see the keep_matrix option of gen_welch_procedure_plots). Any number of
+    candidate warmup lengths can be evaluated at once. The columns between consecutive candidates are
+    summed once per replication, and the post-warmup sums for every candidate then come from one
+    cumulative sum over those segments, so a sweep over l costs about one pass over the matrix instead of
+    one filtering pass per candidate.
+
+    Inputs:
+
+        rep_matrix (NumPy array) = n x m matrix of metric values, rows are replications and columns are
+                                   timesteps 1, 2, ..., m. Needs at least 2 rows and fully populated
+                                   finite values.
+
+        warmup_l (int or list) = The warmup length, or a list (or 1-D NumPy array) of candidate warmup
+                                 lengths, each an int between 0 and m - 1.
+
+        approx_confidence_level_pct (float) = (Optional) Confidence level for the intervals as a
+                                              percentage. For example, provide 95.0 for 95% intervals.
+                                              Defaults to 95.0
+
+    Outputs:
+
+        If warmup_l is an int:
+
+            out_lst (list) = A list where index 0 is the CI lower bound, index 1 is X_bar(l), and index
+                             2 is the CI upper bound.
+
+        If warmup_l is a list or NumPy array:
+
+            out_arr (NumPy array) = A len(warmup_l) x 3 array whose rows are [CI lower bound, X_bar(l),
+                                    CI upper bound] for each candidate, in the order given.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_replication_deletion_ci.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Confirm User Inputs -----------------------
+    # rep_matrix needs to be two dimensional with at least 2 replications
+    wrk_mat = np.asarray(rep_matrix)
+    if not (wrk_mat.ndim == 2 and wrk_mat.shape[0] >= 2 and wrk_mat.shape[1] >= 1):
+        raise Exception('rep_matrix needs to be a two dimensional array with at least 2 rows')
+
+    # rep_matrix needs to be numeric and fully populated
+    if not (np.issubdtype(wrk_mat.dtype, np.number) and np.isfinite(wrk_mat).all()):
+        raise Exception('rep_matrix needs to be fully populated with finite values')
+
+    # warmup_l needs to be an int or a list of ints between 0 and m - 1
+    m = wrk_mat.shape[1]
+    if isinstance(warmup_l,int):
+        l_arr = np.array([warmup_l])
+    elif isinstance(warmup_l,(list, np.ndarray)):
+        l_arr = np.asarray(warmup_l)
+        if not (l_arr.ndim == 1 and len(l_arr) > 0 and
+                (np.issubdtype(l_arr.dtype, np.integer) or all(isinstance(i,int) for i in warmup_l))):
+            raise Exception('warmup_l needs to be an int or a non-empty list of ints')
+    else:
+        raise Exception('warmup_l needs to be an int or a non-empty list of ints')
+    if not ((l_arr >= 0).all() and (l_arr <= m - 1).all()):
+        raise Exception('Each warmup length needs to be between 0 and m - 1')
+
+    # approx_confidence_level_pct needs to be a float between 0 and 100
+    if not (isinstance(approx_confidence_level_pct,float) and 0.0 < approx_confidence_level_pct < 100.0):
+        raise Exception('approx_confidence_level_pct needs to be a float between 0.0 and 100.0')
+    #------------------ End Confirm User Inputs -------------------
+
+    n = wrk_mat.shape[0]
+
+    # Sum each replication's columns between consecutive distinct candidates (in float64)
+    l_uniq, l_pos = np.unique(l_arr, return_inverse = True)
+    seg_sums = np.add.reduceat(wrk_mat, l_uniq, axis = 1, dtype = 'float64')
+
+    # Post-warmup sum for each candidate: the segment sums from that candidate onward
+    tail_sums = np.cumsum(seg_sums[:, ::-1], axis = 1)[:, ::-1]
+
+    # Truncated mean X_j(l) for every replication (rows) and candidate (columns)
+    rep_means = tail_sums / (m - l_uniq)
+
+    # Mean and variance across replications for every candidate
+    grand_means = rep_means.mean(axis = 0)
+    rep_vars = rep_means.var(axis = 0, ddof = 1)
+
+    # t based half width
+    alpha = 1.0 - (approx_confidence_level_pct/100.0)
+    t_val = float(t.ppf(1.0 - (alpha/2.0), n - 1))
+    half_widths = t_val * np.sqrt(rep_vars / n)
+
+    out_arr = np.column_stack((grand_means - half_widths, grand_means, grand_means + half_widths))[l_pos]
+
+    # Return a single interval, or one row per candidate
+    if isinstance(warmup_l,int):
+        return out_arr[0].tolist()
+    else:
+        return out_arr
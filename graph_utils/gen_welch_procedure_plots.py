@@ -5,15 +5,22 @@
 #------------ Define Imports -----------
 import pandas as pd
 from pandas import DataFrame as df
-import plotly.graph_objects as go
-import copy
-import math
+import numpy as np
 #---------------------------------------
 
-def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metric_col: str,
+#--------------- Import user defined functions -------------
+from welch_procedure_helpers import check_rep_timestep_structure, check_welch_plot_args
+from welch_result import WelchResult
+#-----------------------------------------------------------
+
+def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metric_col,
                               n: int, m: int, time_step_units: str, units_per_timestep: float, 
-                              first_timestep_units: float, metric_name: str = None,
-                              w: int = None, x_axis_units = True) -> list:
+                              first_timestep_units: float, metric_name = None,
+                              w = None, x_axis_units = True, engine: str = 'matrix',
+                              compute_only: bool = False, mark_warmup: bool = False,
+                              render_mode: str = 'auto', max_plot_points: int = 10000,
+                              ci_level: float = 95.0, show_ci_band: bool = False,
+                              keep_matrix: bool = False, compact: bool = False):
     
     """
     Description:
@@ -32,7 +39,8 @@ def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metri
     correspond to the replication number, timestep number, and metric value respectively. Replications
     are numbered 1, 2, ..., n, and the associated column must be int64 and fully populated. The timestep 
     column must be int64 and timesteps take on values 1, 2, ..., m. The metric column must be int64 or 
-    float64 and fully populated.
+    float64 and fully populated. With compact set to True, narrower column types (e.g., int32 or uint16
+    replications and timesteps, float32 metrics) are accepted as they are.
 
     The function retuns a list with 2 plots. The index 0 plot gives the average metric value over all
     replications (y-axis) over timesteps (x-axis). This index 0 plot is not a moving average. The 
@@ -58,7 +66,11 @@ def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metri
 
             time_step_col (string): Name of the column within in_df holding timesteps.
 
-            metric_col (string): Name of the column within in_df holding metric values.
+            metric_col (string or list): Name of the column within in_df holding metric values. A list
+                                         of column names can be provided to analyze several metrics in
+                                         one call; the replication/timestep structure is then checked
+                                         once and the same replication/timestep placement is reused for
+                                         every metric.
 
             n (int): The number of simulation replications included in in_df.
 
@@ -74,14 +86,80 @@ def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metri
                                           timestep is 2.5 hours you may want timestep 1 to be 0.0 
                                           units or 2.5 units)
         
-            metric_name (string): (Optional) A name for the metric to use in the plots
+            metric_name (string or list): (Optional) A name for the metric to use in the plots. If
+                                          metric_col is a list, a list of names of the same length.
+                                          Defaults to "Metric" for a single metric and to the column
+                                          names for a list of metrics
 
-            w (int): (Optional) The number of timesteps for the moving-average window for
+            w (int or list): (Optional) The number of timesteps for the moving-average window for
                                 the index 1 plot. If not provided, value defaults to the floor(# of 
-                                timesteps in replication / 4)
+                                timesteps in replication / 4). A list of ints can be provided to compare
+                                several windows at once, in which case the index 1 plot holds one trace
+                                per window. All windows are computed from a single prefix sum of the
+                                timestep means
             
             x_axis_units (bool): (Optional) True means you want the plot x-axis values in units. False 
                                             means you want the values in timesteps. Defaults to True
+
+            engine (string): (Optional) How the timestep means are computed. 'matrix' places the metric
+                             values into a dense n x m NumPy matrix (rows are replications, columns are
+                             timesteps) and takes every timestep mean in one pass over the matrix columns.
+                             'loop' filters in_df once per timestep (O(m*n*m) work, kept for reference).
+                             Both engines produce the same timestep means. Defaults to 'matrix'
+
+            compute_only (bool): (Optional) True returns a WelchResult holding the outputs below as
+                                 NumPy arrays, without building the figures or copying the arrays into
+                                 lists. Figures can still be built later with WelchResult.gen_figures().
+                                 Defaults to False
+
+            mark_warmup (bool): (Optional) True draws a dashed vertical line on both figures at the
+                                warmup length suggested by the MSER-5 rule (see gen_mser_warmup and
+                                out_lst [7] below). Defaults to False
+
+            render_mode (string): (Optional) How the figures are drawn. 'svg' draws every point with
+                                  go.Scatter as 'lines+markers'. 'webgl' draws with go.Scattergl as lines
+                                  and reduces each trace to at most max_plot_points points with
+                                  shape-preserving LTTB downsampling (see gen_lttb_downsample). 'auto'
+                                  switches to 'webgl' once a trace has more than max_plot_points points.
+                                  The computed values in out_lst are always at full resolution.
+                                  Defaults to 'auto'
+
+            max_plot_points (int): (Optional) Point threshold for render_mode 'auto' and the most points
+                                   drawn per trace in webgl mode. Defaults to 10000
+
+            ci_level (float): (Optional) Approximate confidence level, as a percentage, for the
+                              per-timestep confidence band of the timestep means (mean -/+ z times the
+                              standard error across replications). Defaults to 95.0
+
+            show_ci_band (bool): (Optional) True draws the confidence band as a shaded band behind the
+                                 timestep means on the index 0 figure. Defaults to False
+
+            keep_matrix (bool): (Optional) True keeps the n x m matrix of metric values (one row per
+                                replication) on the returned WelchResult as rep_matrix, so
+                                autocorrelations and replication/deletion confidence intervals can be
+                                computed from each replication's series (see
+                                WelchResult.gen_autocorrelation and
+                                WelchResult.gen_replication_deletion_ci). Needs engine 'matrix' and adds one
+                                n x m float64 array per metric. Defaults to False
+
+            compact (bool): (Optional) True accepts any integer type (e.g., int32, uint16) for the
+                            rep_col and time_step_col columns and any integer or float type (e.g.,
+                            float32) for the metric_col column, instead of only int64 and int64/float64.
+                            The metric columns are never copied or upcast as a whole: metric values are
+                            converted to float64 in blocks of about 1M values as they are written into the
+                            n x m matrix (or per timestep with the loop engine), so every mean and variance is
+                            still accumulated in float64. Defaults to False
+
+                            Approximate memory per (replication, timestep) row with the matrix engine:
+
+                                in_df columns, default types (int64, int64, float64): 24 bytes
+                                in_df columns, compact types (int32, int32, float32): 12 bytes
+                                (int16/uint16 replications and timesteps: 8 bytes)
+                                working memory, both modes: about 16 bytes (the float64 matrix plus the
+                                int64 position of each value within it, which is also what the input
+                                checks use), plus blocks of about 1M values (roughly 25 MB in all), plus
+                                8 bytes per kept matrix per metric with keep_matrix. Measured with
+                                tracemalloc at n = 50 and m = 100000: about 20 bytes per row in both modes
     
     Outputs:
 
@@ -97,6 +175,23 @@ def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metri
                                       to the m-w timestep
                                 [5] - x coordinates for figure at index 0
                                 [6] - x coordinates for figure at index 1
+                                [7] - suggested warmup length l in timesteps from the MSER-5 rule
+                                      applied to the timestep means
+                                [8] - list of metric variances over replications by timestep
+                                [9] - list of lower bounds of the per-timestep confidence band
+                                [10] - list of upper bounds of the per-timestep confidence band
+
+                            If w is provided as a list, [3] is that list and [4] and [6] hold one list
+                            per window, in the same order as w.
+
+            If metric_col is a list, a dictionary is returned instead, mapping each metric column to
+            the [fig_0, fig_1, out_lst] list (or WelchResult) for that metric.
+
+            If compute_only is True, a WelchResult is returned instead, with attributes reps, timesteps,
+            timestep_means, w, moving_avgs, plot_x, plot_x_2, warmup_l, timestep_vars, ci_lower and
+            ci_upper matching [0] - [10] above. Its gen_autocorrelation and gen_correlogram methods give
+            FFT-based autocorrelation diagnostics (see gen_fft_autocorrelation) of the timestep means
+            after the warmup period.
 
     Testing:
 
@@ -121,8 +216,15 @@ def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metri
     if not rep_col in in_df.columns:
         raise Exception("rep_col needs to be the name of a column within in_df")
     
-    # The rep_col column within in_df needs to be int64
-    if not in_df[rep_col].dtype == 'int64':
+    # compact needs to be a boolean
+    if not isinstance(compact,bool):
+        raise Exception('compact needs to be a bool')
+
+    # The rep_col column within in_df needs to be int64 (any integer type in compact mode)
+    if compact:
+        if not pd.api.types.is_integer_dtype(in_df[rep_col].dtype):
+            raise Exception('rep_col within in_df needs to be an integer type')
+    elif not in_df[rep_col].dtype == 'int64':
         raise Exception('rep_col within in_df needs to be int64')
     
     # time_step_col needs to be a string
@@ -133,25 +235,45 @@ def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metri
     if not time_step_col in in_df.columns:
         raise Exception('time_step_col needs to be a column within in_df')
     
-    # The time_step_col in in_df needs to be int64
-    if not in_df[time_step_col].dtype == 'int64':
+    # The time_step_col in in_df needs to be int64 (any integer type in compact mode)
+    if compact:
+        if not pd.api.types.is_integer_dtype(in_df[time_step_col].dtype):
+            raise Exception('The time_step_col column in in_df needs to be an integer type')
+    elif not in_df[time_step_col].dtype == 'int64':
         raise Exception('The time_step_col column in in_df needs to be of type int64')
     
-    # metric_col needs to be a string
-    if not isinstance(metric_col,str):
+    # metric_col needs to be a string (or a non-empty list of strings)
+    if isinstance(metric_col,list):
+        if len(metric_col) == 0:
+            raise Exception('metric_col needs to be a non-empty list if provided as a list')
+        for i in metric_col:
+            if not isinstance(i,str):
+                raise Exception('Each entry in metric_col needs to be a string')
+        if not len(set(metric_col)) == len(metric_col):
+            raise Exception('metric_col needs to be a column name or a list of unique column names')
+        metric_lst = metric_col
+    elif isinstance(metric_col,str):
+        metric_lst = [metric_col]
+    else:
         raise Exception('metric_col needs to be a string')
-    
-    # metric_col needs to be a column within in_df
-    if not metric_col in in_df.columns:
-        raise Exception('metric_col needs to be a column within in_df')
-    
-    # metric_col column in in_df needs to be int64 or float64
-    if not (in_df[metric_col].dtype == 'int64' or in_df[metric_col].dtype == 'float64'):
-        raise Exception('The metric_col column within in_df needs to be int64 or float64')
 
-    # if metric_col column in in_df is float64 it needs to be fully populated
-    if not len(in_df[metric_col]) == in_df[metric_col].count():
-        raise Exception('The metric col column within in_df needs to be fully populated')
+    for cur_metric in metric_lst:
+    
+        # metric_col needs to be a column within in_df
+        if not cur_metric in in_df.columns:
+            raise Exception('metric_col needs to be a column within in_df')
+        
+        # metric_col column in in_df needs to be int64 or float64 (any integer or float type in compact mode)
+        if compact:
+            if not (pd.api.types.is_integer_dtype(in_df[cur_metric].dtype) or
+                    pd.api.types.is_float_dtype(in_df[cur_metric].dtype)):
+                raise Exception('The metric_col column within in_df needs to be an integer or float type')
+        elif not (in_df[cur_metric].dtype == 'int64' or in_df[cur_metric].dtype == 'float64'):
+            raise Exception('The metric_col column within in_df needs to be int64 or float64')
+
+        # if metric_col column in in_df is float64 it needs to be fully populated
+        if not len(in_df[cur_metric]) == in_df[cur_metric].count():
+            raise Exception('The metric col column within in_df needs to be fully populated')
     
     # n needs to be an int
     if not isinstance(n,int):
@@ -169,211 +291,145 @@ def gen_welch_procedure_plots(in_df: df, rep_col: str, time_step_col: str, metri
     if not int(m) == int(in_df[time_step_col].max()):
         raise Exception('m needs to be the maximum timestep within in_df')
     
-    # time_step_units needs to be a string
-    if not isinstance(time_step_units,str):
-        raise Exception('time_step_units needs to be of type str')
-    
-    # units_per_timestep needs to be a float
-    if not isinstance(units_per_timestep,float):
-        raise Exception('units_per_timestep needs to be a float')
-    
-    # first_timestep_units needs to be a float
-    if not isinstance(first_timestep_units,float):
-        raise Exception('first_timestep_units needs to be a float')
-    
-    # If provided, metric_name needs to be a string
+    # If provided, metric_name needs to be a string (or a list of strings matching metric_col)
     if not metric_name == None:
-        if not isinstance(metric_name,str):
+        if isinstance(metric_col,list):
+            if not (isinstance(metric_name,list) and len(metric_name) == len(metric_col) and
+                    all(isinstance(i,str) for i in metric_name)):
+                raise Exception('metric_name needs to be a list of strings matching metric_col if provided')
+        elif not isinstance(metric_name,str):
             raise Exception('metric_name needs to be a string if provided')
+
+    # Name to use in the plots for each metric
+    if isinstance(metric_col,list):
+        if metric_name == None:
+            name_lst = list(metric_col)
+        else:
+            name_lst = metric_name
+    else:
+        name_lst = [metric_name]
     
-    # if w is provided it needs to be an int
-    if not w == None:
-        if not isinstance(w,int):
-            raise Exception('w needs to be an int if provided')
-    
-    # x_axis_units needs to be a boolean
-    if not isinstance(x_axis_units,bool):
-        raise Exception('x_axis_units needs to be a bool')
+    # engine needs to be 'matrix' or 'loop'
+    if not engine in ['matrix', 'loop']:
+        raise Exception("engine needs to be 'matrix' or 'loop'")
+
+    # The plotting arguments need to be valid
+    check_welch_plot_args(time_step_units, units_per_timestep, first_timestep_units, w, x_axis_units, compute_only,
+                          mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band)
+
+    # keep_matrix needs to be a boolean, and the matrix only exists for the matrix engine
+    if not isinstance(keep_matrix,bool):
+        raise Exception('keep_matrix needs to be a bool')
+    if keep_matrix and not engine == 'matrix':
+        raise Exception("keep_matrix needs engine to be 'matrix'")
     
     # make sure in_df has the correct number of rows
     if not len(in_df) == n*m:
         raise Exception("m and n don't match with the number of rows in in_df")
     
-    # Create working dataframe
-    wrk_df = in_df.copy()
+    # Columns are read in place (to_numpy gives views of the DataFrame's arrays, without copies)
+    rep_arr = in_df[rep_col].to_numpy()
+    ts_arr = in_df[time_step_col].to_numpy()
 
-    # make sure the replication numbers are correct within in_df
-    for i in wrk_df[rep_col].unique().tolist():
-        if not len(wrk_df[wrk_df[rep_col] == i]) == m:
-            raise Exception("in_df has the wrong number of rows for replication {}".format(i))
-        
-    # make sure the timesteps are correct within in_df
-    for i in wrk_df[rep_col].unique().tolist():
-        temp_filter = wrk_df[wrk_df[rep_col]==i].copy().reset_index(drop=True)
-        if not sorted(temp_filter[time_step_col].tolist()) == sorted(range(1,m+1,1)):
-            raise Exception("in_df has incorrect timesteps for replication {}".format(i))
+    # make sure the replication numbers and timesteps are correct within in_df (cell_idx is the position
+    # of each row within the n x m matrix of the matrix engine)
+    cell_idx = check_rep_timestep_structure(rep_arr, ts_arr, m)
     #------------------ End Confirm User Inputs -------------------
 
-    # Convert metric column to float
-    wrk_df[metric_col] = wrk_df[metric_col].astype('float64')
-
-    # Define list to return
-    return_lst = []
-
-    # Define output list
-    out_lst = []
-
     # Get list of replications
-    reps = sorted(wrk_df[rep_col].unique().tolist())
-    out_lst.append(copy.deepcopy(reps))
-    
-    # Get list of timesteps
-    timesteps = sorted(wrk_df[time_step_col].unique().tolist())
-    out_lst.append(copy.deepcopy(timesteps))
-
-    # Create list to hold metric mean over replications by timestep
-    timestep_means = []
-
-    # Iterate through timesteps
-    for t in timesteps:
-
-        # Filter DataFrame down to just rows for the timestep
-        ts_filter_df = wrk_df[wrk_df[time_step_col] == t].copy().reset_index(drop=True)
-
-        # Add the mean value to the list
-        timestep_means.append(float(ts_filter_df[metric_col].mean()))
-
-    # Store timestep_means for output
-    out_lst.append(copy.deepcopy(timestep_means))
-
-    # If needed, compute w
-    if w == None:
-        w = math.floor(m/4)
-    
-    # Save w
-    out_lst.append(w)
-    
-    # Compute list containing moving average values for the first timestep to the m-w timestep
-    moving_avgs = []
-    for t in timesteps:
-
-        # Only compute if t <= m-w
-        if t <= (m - w):
-
-            if t <= w:
-                cur_mvg_avg = float(sum(timestep_means[0:((2*t)-1)]))/float((2*t-1))
+    reps = sorted(pd.unique(rep_arr).tolist())
+    
+    # Get list of timesteps (the input checks above guarantee they are 1, 2, ..., m)
+    timesteps = list(range(1, m + 1))
+
+    # Create lists to hold metric mean and variance over replications by timestep, for each metric
+    rep_mat_lst = [None for i in metric_lst]
+    if engine == 'matrix':
+
+        # Each metric value goes to [replication row, timestep - 1] of a dense n x m matrix. The input
+        # checks above guarantee every (replication, timestep) cell is filled exactly once. The placement
+        # is computed once and the matrix buffer is reused for every metric.
+        metric_mat = np.empty((len(reps), m), dtype = 'float64')
+
+        # Rows are written, and squared deviations summed, in blocks of about 1M values so no other
+        # full-length array is needed
+        block_rows = max(1, 1048576 // m)
+
+        timestep_means_lst = []
+        timestep_vars_lst = []
+        for i, cur_metric in enumerate(metric_lst):
+
+            # Each kept matrix needs its own buffer
+            if keep_matrix and i > 0:
+                metric_mat = np.empty((len(reps), m), dtype = 'float64')
+
+            # Values are converted to float64 block by block as they are written, so sums accumulate in float64
+            metric_flat = metric_mat.reshape(-1)
+            metric_values = in_df[cur_metric].to_numpy()
+            for start in range(0, len(cell_idx), block_rows * m):
+                metric_flat[cell_idx[start:start + (block_rows * m)]] = metric_values[start:start + (block_rows * m)]
+            if keep_matrix:
+                rep_mat_lst[i] = metric_mat
+
+            # Average down the columns to get every timestep mean in one pass
+            timestep_means = metric_mat.mean(axis = 0)
+            timestep_means_lst.append(timestep_means)
+
+            # Variance down the columns of the same matrix (undefined for a single replication). Timesteps
+            # with an inf value have a NaN variance, so inf - inf isn't warned about.
+            if len(reps) > 1:
+                sq_devs = np.zeros(m)
+                with np.errstate(invalid = 'ignore'):
+                    for start in range(0, len(reps), block_rows):
+                        block_devs = metric_mat[start:start + block_rows] - timestep_means
+                        block_devs *= block_devs
+                        sq_devs += block_devs.sum(axis = 0)
+                timestep_vars_lst.append(sq_devs / (len(reps) - 1))
             else:
-                cur_mvg_avg = float(sum(timestep_means[(t-w-1):(t+w)]))/float((2*w)+1.0)
-            
-            moving_avgs.append(float(cur_mvg_avg))
-    
-    # Store moving_avgs
-    out_lst.append(copy.deepcopy(moving_avgs))
-
-    #----------------------- Build index 0 chart -----------------------------
-    # Create figure
-    fig_0 = go.Figure()
-
-    # Compute plot x values
-    plot_x = []
-    if x_axis_units:
-        first_t = True
-        for t in timesteps:
-            if first_t:
-                plot_x.append(float(first_timestep_units))
-                first_t = False
-            else:
-                plot_x.append(float(plot_x[len(plot_x)-1]) + float(units_per_timestep))
-    else:
-       for t in timesteps:
-           plot_x.append(float(t))
-    
-    # Store plot x values
-    out_lst.append(copy.deepcopy(plot_x))
-
-    # Add data to plot
-    fig_0.add_trace(go.Scatter(x = copy.deepcopy(plot_x), y = copy.deepcopy(timestep_means), mode = 'lines+markers'))
-
-    # Get name for metric 
-    if not metric_name == None:
-        metric_n = metric_name
-    else:
-        metric_n = "Metric"
+                timestep_vars_lst.append(np.full(m, np.nan))
 
-    # Add Title
-    fig_0.update_layout(title = {'text': '{} Mean over Replications by Timestep'.format(metric_n),
-                                 'font': {'size': 30}, 'x': 0.5})
-
-    # Add X-Axis Label
-    if x_axis_units:
-        fig_0.update_layout(xaxis_title = time_step_units, 
-                          xaxis_title_font = dict(size = 25))
     else:
-        fig_0.update_layout(xaxis_title = "Timestep", 
-                          xaxis_title_font = dict(size = 25))
-
-    # Add Y-Axis Label
-    fig_0.update_layout(yaxis_title = "{} Mean over {} Replications".format(metric_n,n), 
-                        yaxis_title_font = dict(size = 25))
-    
-    # Set x-axis tick size and tick standoff
-    fig_0.update_layout(xaxis = dict(tickfont = dict(size = 20)))
-    fig_0.update_xaxes(ticklabelstandoff = 10)
-
-    # Set y-axis tick size and tick standoff
-    fig_0.update_layout(yaxis = dict(tickfont = dict(size = 20)))
-    fig_0.update_yaxes(ticklabelstandoff = 10)
+        # The matrix positions aren't needed by the loop engine
+        del cell_idx
 
-    # Lock Axes
-    fig_0.update_xaxes(fixedrange = True)
-    fig_0.update_yaxes(fixedrange = True)
+        timestep_means_lst = [[] for i in metric_lst]
+        timestep_vars_lst = [[] for i in metric_lst]
 
-    # Set figure size
-    fig_0.update_layout(width = 900, height = 600)
-    #----------------------- End build index 0 chart ------------------------
-
-    #----------------------- Build index 1 chart -----------------------------
-    # Create figure
-    fig_1 = go.Figure()
-
-    # Compute plot x values
-    plot_x_2 = plot_x[:m - w]
-    out_lst.append(copy.deepcopy(plot_x_2))
-
-    # Add data to plot
-    fig_1.add_trace(go.Scatter(x = copy.deepcopy(plot_x_2), y = copy.deepcopy(moving_avgs), mode = 'lines+markers'))
+        # Iterate through timesteps
+        for t in timesteps:
 
-    # Add Title
-    fig_1.update_layout(title = {'text': 'Moving Average of Timestep Mean {} by Timestep'.format(metric_n),
-                                 'font': {'size': 30}, 'x': 0.5})
-    
-    # Add X-Axis Label
-    if x_axis_units:
-        fig_1.update_layout(xaxis_title = time_step_units, 
-                          xaxis_title_font = dict(size = 25))
+            # Rows for the timestep
+            ts_mask = ts_arr == t
+
+            # Add the mean and variance (computed in float64) to the lists
+            for i, cur_metric in enumerate(metric_lst):
+                ts_values = in_df[cur_metric].to_numpy()[ts_mask].astype('float64')
+                timestep_means_lst[i].append(float(ts_values.mean()))
+                if len(ts_values) > 1:
+                    with np.errstate(invalid = 'ignore'):
+                        timestep_vars_lst[i].append(float(ts_values.var(ddof = 1)))
+                else:
+                    timestep_vars_lst[i].append(np.nan)
+
+    out_dict = {}
+    for cur_metric, cur_name, timestep_means, timestep_vars, rep_mat in zip(metric_lst, name_lst,
+                                                                            timestep_means_lst,
+                                                                            timestep_vars_lst, rep_mat_lst):
+
+        # Compute moving averages and x coordinates
+        result = WelchResult(reps, np.asarray(timestep_means), w, time_step_units, units_per_timestep,
+                             first_timestep_units, cur_name, x_axis_units, mark_warmup, render_mode,
+                             max_plot_points, timestep_vars = np.asarray(timestep_vars), ci_level = ci_level,
+                             show_ci_band = show_ci_band, rep_matrix = rep_mat)
+
+        # Keep the result object, or build figures and output list
+        if compute_only:
+            out_dict[cur_metric] = result
+        else:
+            out_dict[cur_metric] = result.to_plot_lst()
+
+    # Return a single result, or one per metric
+    if isinstance(metric_col,list):
+        return out_dict
     else:
-        fig_1.update_layout(xaxis_title = "Timestep", 
-                          xaxis_title_font = dict(size = 25))
-
-    # Add Y-Axis Label
-    fig_1.update_layout(yaxis_title = "Moving Average", 
-                        yaxis_title_font = dict(size = 25))
-    
-    # Set x-axis tick size and tick standoff
-    fig_1.update_layout(xaxis = dict(tickfont = dict(size = 20)))
-    fig_1.update_xaxes(ticklabelstandoff = 10)
-
-    # Set y-axis tick size and tick standoff
-    fig_1.update_layout(yaxis = dict(tickfont = dict(size = 20)))
-    fig_1.update_yaxes(ticklabelstandoff = 10)
-
-    # Lock Axes
-    fig_1.update_xaxes(fixedrange = True)
-    fig_1.update_yaxes(fixedrange = True)
-
-    # Set figure size
-    fig_1.update_layout(width = 900, height = 600)
-    #----------------------- End build index 1 chart -----------------------------
-
-    # Return values
-    return [fig_0,fig_1,out_lst]
\ No newline at end of file
+        return out_dict[metric_col]
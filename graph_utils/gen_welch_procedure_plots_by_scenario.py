@@ -0,0 +1,198 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import pandas as pd
+from pandas import DataFrame as df
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from welch_procedure_helpers import check_welch_plot_args
+from welch_result import WelchResult
+#-----------------------------------------------------------
+
+def gen_welch_procedure_plots_by_scenario(in_df: df, scenario_col: str, rep_col: str, time_step_col: str,
+                                          metric_col: str, time_step_units: str, units_per_timestep: float,
+                                          first_timestep_units: float, metric_name: str = None, w = None,
+                                          x_axis_units = True, mark_warmup: bool = False,
+                                          max_workers: int = 1, render_mode: str = 'auto',
+                                          max_plot_points: int = 10000, ci_level: float = 95.0,
+                                          show_ci_band: bool = False) -> dict:
+
+    """
+    Description:
+
+    This function runs Welch's procedure (Law p.407-409, see gen_welch_procedure_plots) for every
+    scenario of a designed experiment held in one long table. Each row of in_df is a combination of
+    scenario, replication and timestep. Instead of splitting the table and calling
+    gen_welch_procedure_plots once per scenario, the replication/timestep structure of every scenario is
+    validated with one grouped aggregation and every scenario's timestep means and variances come from
+    one grouped aggregation over (scenario, timestep).
+
+    Scenarios may have different numbers of replications and timesteps. Within a scenario, m is the
+    largest timestep, and each replication must have exactly m rows covering timesteps 1, 2, ..., m.
+    Optionally, scenarios can be split into groups that are processed in a process pool.
+
+    Inputs:
+
+        in_df (Pandas DataFrame) = Simulation output with at least the 4 user specified columns below.
+
+        scenario_col (string) = Name of the fully populated column within in_df identifying the scenario.
+
+        rep_col (string) = Name of the int64 column within in_df holding replication numbers.
+
+        time_step_col (string) = Name of the int64 column within in_df holding timesteps.
+
+        metric_col (string) = Name of the fully populated int64 or float64 column within in_df holding
+                              metric values.
+
+        time_step_units, units_per_timestep, first_timestep_units, metric_name, w, x_axis_units,
+        mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band = As in
+                                     gen_welch_procedure_plots. Applied to every scenario.
+
+        max_workers (int) = (Optional) Number of worker processes. With 1 (the default) all scenarios are
+                            handled in the calling process in a single grouped pass; with more, the
+                            scenarios are split into groups and each group's grouped pass runs in a
+                            worker.
+
+    Outputs:
+
+        out_dict (Dictionary) = Maps each scenario to the WelchResult for that scenario (figures are
+                                built on request with WelchResult.gen_figures()).
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_welch_procedure_plots_by_scenario.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Confirm User Inputs -----------------------
+    # in_df needs to be a DataFrame
+    if not isinstance(in_df, df):
+        raise Exception("in_df needs to be a Pandas DataFrame")
+
+    # The four columns need to be strings naming columns within in_df
+    for col_name, col in [('scenario_col', scenario_col), ('rep_col', rep_col), ('time_step_col', time_step_col),
+                          ('metric_col', metric_col)]:
+        if not isinstance(col,str):
+            raise Exception('{} needs to be a string'.format(col_name))
+        if not col in in_df.columns:
+            raise Exception('{} needs to be the name of a column within in_df'.format(col_name))
+
+    # scenario_col needs to be fully populated
+    if not len(in_df[scenario_col]) == in_df[scenario_col].count():
+        raise Exception('The scenario_col column within in_df needs to be fully populated')
+
+    # rep_col and time_step_col need to be int64
+    if not in_df[rep_col].dtype == 'int64':
+        raise Exception('rep_col within in_df needs to be int64')
+    if not in_df[time_step_col].dtype == 'int64':
+        raise Exception('The time_step_col column in in_df needs to be of type int64')
+
+    # metric_col needs to be int64 or float64 and fully populated
+    if not (in_df[metric_col].dtype == 'int64' or in_df[metric_col].dtype == 'float64'):
+        raise Exception('The metric_col column within in_df needs to be int64 or float64')
+    if not len(in_df[metric_col]) == in_df[metric_col].count():
+        raise Exception('The metric col column within in_df needs to be fully populated')
+
+    # The plotting arguments need to be valid (there is no compute_only option here)
+    check_welch_plot_args(time_step_units, units_per_timestep, first_timestep_units, w, x_axis_units, False,
+                          mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band)
+
+    # If provided, metric_name needs to be a string
+    if not metric_name == None:
+        if not isinstance(metric_name,str):
+            raise Exception('metric_name needs to be a string if provided')
+
+    # max_workers needs to be a positive int
+    if not (isinstance(max_workers,int) and max_workers > 0):
+        raise Exception('max_workers needs to be a positive int')
+    #------------------ End Confirm User Inputs -------------------
+
+    # Only the 4 user specified columns are needed
+    wrk_df = in_df[[scenario_col, rep_col, time_step_col, metric_col]]
+    plot_args = {'w' : w, 'time_step_units' : time_step_units, 'units_per_timestep' : units_per_timestep,
+                 'first_timestep_units' : first_timestep_units, 'metric_name' : metric_name,
+                 'x_axis_units' : x_axis_units, 'mark_warmup' : mark_warmup, 'render_mode' : render_mode,
+                 'max_plot_points' : max_plot_points, 'ci_level' : ci_level, 'show_ci_band' : show_ci_band}
+
+    # Handle every scenario in one grouped pass
+    scenarios = pd.unique(wrk_df[scenario_col])
+    max_workers = min(max_workers, len(scenarios))
+    if max_workers == 1:
+        return _welch_results_by_scenario(wrk_df, scenario_col, rep_col, time_step_col, metric_col, plot_args)
+
+    # Split the scenarios into groups and run each group's grouped pass in a worker
+    scenario_groups = np.array_split(np.array(scenarios, dtype = object), max_workers)
+    scenario_codes = pd.Categorical(wrk_df[scenario_col], categories = scenarios).codes
+    group_of_code = np.concatenate([np.full(len(g), i) for i, g in enumerate(scenario_groups)])
+    row_groups = group_of_code[scenario_codes]
+    chunk_lst = [wrk_df[row_groups == i] for i in range(len(scenario_groups))]
+
+    out_dict = {}
+    with ProcessPoolExecutor(max_workers = max_workers) as executor:
+        for part_dict in executor.map(_welch_results_by_scenario, chunk_lst, [scenario_col] * len(chunk_lst),
+                                      [rep_col] * len(chunk_lst), [time_step_col] * len(chunk_lst),
+                                      [metric_col] * len(chunk_lst), [plot_args] * len(chunk_lst)):
+            out_dict.update(part_dict)
+
+    # Keep the same scenario order as the single-process path
+    return {scenario: out_dict[scenario] for scenario in sorted(out_dict)}
+
+
+def _welch_results_by_scenario(wrk_df: df, scenario_col: str, rep_col: str, time_step_col: str,
+                               metric_col: str, plot_args: dict) -> dict:
+
+    """
+    Validates the replication/timestep structure of every scenario in wrk_df with one grouped
+    aggregation, computes every scenario's timestep means and variances with one grouped aggregation,
+    and returns a
+    dictionary mapping each scenario (sorted) to its WelchResult.
+    """
+
+    # m for each scenario is its largest timestep (observed = True leaves out unused categories of a
+    # Categorical column, which have no rows)
+    scenario_m = wrk_df.groupby(scenario_col, sort = True, observed = True)[time_step_col].max()
+
+    # Size, timestep range and distinct timesteps for every (scenario, replication)
+    rep_stats = wrk_df.groupby([scenario_col, rep_col], sort = True, observed = True)[time_step_col].agg(['size', 'min', 'max', 'nunique'])
+    rep_m = scenario_m.reindex(rep_stats.index.get_level_values(0)).to_numpy()
+
+    # make sure the replication numbers are correct within each scenario
+    bad_size = rep_stats['size'].to_numpy() != rep_m
+    if bad_size.any():
+        scenario, rep = rep_stats.index[np.flatnonzero(bad_size)[0]]
+        raise Exception("in_df has the wrong number of rows for replication {} in scenario {}".format(rep, scenario))
+
+    # make sure the timesteps are correct within each scenario
+    bad_ts = ((rep_stats['min'].to_numpy() < 1) | (rep_stats['max'].to_numpy() > rep_m) |
+              (rep_stats['nunique'].to_numpy() != rep_m))
+    if bad_ts.any():
+        scenario, rep = rep_stats.index[np.flatnonzero(bad_ts)[0]]
+        raise Exception("in_df has incorrect timesteps for replication {} in scenario {}".format(rep, scenario))
+
+    # Every scenario's timestep means and variances in one grouped pass (timesteps sorted within each scenario)
+    ts_stats = wrk_df[metric_col].astype('float64').groupby([wrk_df[scenario_col], wrk_df[time_step_col]],
+                                                            sort = True, observed = True).agg(['mean', 'var'])
+
+    # Split the grouped results by scenario
+    ts_bounds = np.concatenate(([0], np.cumsum(scenario_m.to_numpy())))
+    rep_lst = rep_stats.index.get_level_values(1).to_numpy()
+    rep_bounds = np.concatenate(([0], np.cumsum(rep_stats.groupby(level = 0, sort = True,
+                                                                  observed = True).size().to_numpy())))
+    ts_mean_arr = ts_stats['mean'].to_numpy()
+    ts_var_arr = ts_stats['var'].to_numpy()
+
+    out_dict = {}
+    for i, scenario in enumerate(scenario_m.index):
+        out_dict[scenario] = WelchResult(rep_lst[rep_bounds[i]:rep_bounds[i + 1]],
+                                         ts_mean_arr[ts_bounds[i]:ts_bounds[i + 1]],
+                                         timestep_vars = ts_var_arr[ts_bounds[i]:ts_bounds[i + 1]], **plot_args)
+
+    return out_dict
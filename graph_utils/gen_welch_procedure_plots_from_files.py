@@ -0,0 +1,199 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import pandas as pd
+import numpy as np
+import os
+import glob
+from concurrent.futures import ProcessPoolExecutor
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from welch_accumulator import WelchAccumulator
+from welch_procedure_helpers import check_welch_plot_args
+#-----------------------------------------------------------
+
+def gen_welch_procedure_plots_from_files(rep_files, m: int, time_step_units: str, units_per_timestep: float,
+                                         first_timestep_units: float, time_step_col: str = None,
+                                         metric_col: str = None, metric_name: str = None, w = None,
+                                         x_axis_units = True, max_workers: int = None, compute_only: bool = False,
+                                         mark_warmup: bool = False, render_mode: str = 'auto',
+                                         max_plot_points: int = 10000, ci_level: float = 95.0,
+                                         show_ci_band: bool = False):
+
+    """
+    Description:
+
+    This function runs Welch's procedure (Law p.407-409, see gen_welch_procedure_plots) when each
+    simulation replication has been written to its own file. Files are read in a process pool and each
+    worker reduces its files straight into per-timestep running sums and counts (a WelchAccumulator).
+    The partial sums are then merged, so the long-format DataFrame of n x m rows required by
+    gen_welch_procedure_plots is never built.
+
+    Supported file types are .npy, .csv and .parquet. A .npy file holds a 1-D numeric array of the m
+    metric values ordered by timestep (index 0 is timestep 1) and is opened with memory-mapping. A .csv
+    or .parquet file holds one row per timestep with the columns named in time_step_col and metric_col;
+    only those two columns are read (memory-mapped where pandas supports it). Reading .parquet files
+    requires pyarrow. Replications are numbered 1, 2, ..., n in the sorted order of the file paths.
+
+    Inputs:
+
+        rep_files (string or list) = A directory holding one file per replication (all .npy, .csv and
+                                     .parquet files in it are used), a glob pattern (e.g.,
+                                     'output/rep_*.npy'), or a list of file paths.
+
+        m (int) = The number of timesteps in each replication.
+
+        time_step_units, units_per_timestep, first_timestep_units, metric_name, w, x_axis_units,
+        compute_only, mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band =
+                                     As in gen_welch_procedure_plots.
+
+        time_step_col (string) = (Optional) Name of the int timestep column (values 1, 2, ..., m) in
+                                 .csv and .parquet files. Required if any such files are given.
+
+        metric_col (string) = (Optional) Name of the int or float metric column in .csv and .parquet
+                              files. Required if any such files are given.
+
+        max_workers (int) = (Optional) Number of worker processes. Defaults to the number of CPUs. With
+                            1, the files are read in the calling process.
+
+    Outputs:
+
+        out_lst (List): [fig_0, fig_1, out_lst] as returned by gen_welch_procedure_plots, or a WelchResult
+                        if compute_only is True.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_welch_procedure_plots_from_files.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Confirm User Inputs -----------------------
+    # rep_files needs to be a string or a list of strings
+    if isinstance(rep_files,str):
+        if os.path.isdir(rep_files):
+            file_lst = [f for f in glob.glob(os.path.join(rep_files, '*')) if f.endswith(('.npy', '.csv', '.parquet'))]
+        else:
+            file_lst = glob.glob(rep_files)
+    elif isinstance(rep_files,list):
+        for i in rep_files:
+            if not isinstance(i,str):
+                raise Exception('Each entry in rep_files needs to be a string')
+        file_lst = list(rep_files)
+    else:
+        raise Exception('rep_files needs to be a directory, glob pattern or list of file paths')
+    file_lst = sorted(file_lst)
+
+    # At least one replication file is needed
+    if len(file_lst) == 0:
+        raise Exception('No replication files were found in rep_files')
+
+    # Each file needs to be a supported type
+    for i in file_lst:
+        if not i.endswith(('.npy', '.csv', '.parquet')):
+            raise Exception('{} needs to be a .npy, .csv or .parquet file'.format(i))
+
+    # m needs to be a positive int
+    if not (isinstance(m,int) and m > 0):
+        raise Exception('m needs to be a positive int')
+
+    # time_step_col and metric_col are needed for .csv and .parquet files
+    if any(not i.endswith('.npy') for i in file_lst):
+        if not (isinstance(time_step_col,str) and isinstance(metric_col,str)):
+            raise Exception('time_step_col and metric_col need to be strings for .csv and .parquet files')
+
+    # If provided, max_workers needs to be a positive int
+    if not max_workers == None:
+        if not (isinstance(max_workers,int) and max_workers > 0):
+            raise Exception('max_workers needs to be a positive int if provided')
+
+    # The plotting arguments are checked before any file is read
+    check_welch_plot_args(time_step_units, units_per_timestep, first_timestep_units, w, x_axis_units, compute_only,
+                          mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band)
+
+    # If provided, metric_name needs to be a string
+    if not metric_name == None:
+        if not isinstance(metric_name,str):
+            raise Exception('metric_name needs to be a string if provided')
+    #------------------ End Confirm User Inputs -------------------
+
+    # Number of worker processes
+    if max_workers == None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(file_lst))
+
+    # Reduce the files into per-timestep sums and counts
+    if max_workers == 1:
+        acc = _sum_rep_files(file_lst, m, time_step_col, metric_col)
+    else:
+
+        # Give each worker several contiguous chunks of files to balance uneven file sizes
+        num_chunks = min(len(file_lst), max_workers * 4)
+        chunk_lst = [chunk.tolist() for chunk in np.array_split(np.array(file_lst, dtype = object), num_chunks)]
+
+        acc = WelchAccumulator(m)
+        with ProcessPoolExecutor(max_workers = max_workers) as executor:
+            for part_acc in executor.map(_sum_rep_files, chunk_lst, [m] * num_chunks,
+                                         [time_step_col] * num_chunks, [metric_col] * num_chunks):
+                acc.merge(part_acc)
+
+    # Every replication needs all m timesteps
+    if not acc.timestep_counts.min() == acc.n:
+        raise Exception('Every replication file needs to hold m timesteps')
+
+    # Build figures and output list
+    return acc.gen_plots(time_step_units, units_per_timestep, first_timestep_units, metric_name, w, x_axis_units,
+                         compute_only, mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band)
+
+
+def _sum_rep_files(file_lst: list, m: int, time_step_col: str, metric_col: str) -> WelchAccumulator:
+
+    """
+    Worker for gen_welch_procedure_plots_from_files. Reads each replication file in file_lst and adds
+    its metric values, ordered by timestep, to a WelchAccumulator that is returned to the caller.
+    """
+
+    acc = WelchAccumulator(m)
+
+    for cur_file in file_lst:
+
+        if cur_file.endswith('.npy'):
+
+            # Memory-map the array so only the pages being summed are read
+            metric_values = np.load(cur_file, mmap_mode = 'r')
+            if not (metric_values.ndim == 1 and len(metric_values) == m):
+                raise Exception('{} needs to hold a 1-D array of m values'.format(cur_file))
+
+        else:
+
+            # Read just the timestep and metric columns
+            if cur_file.endswith('.csv'):
+                rep_df = pd.read_csv(cur_file, usecols = [time_step_col, metric_col], memory_map = True)
+            else:
+                rep_df = pd.read_parquet(cur_file, columns = [time_step_col, metric_col], memory_map = True)
+
+            # The timesteps need to be 1, 2, ..., m once each (all in range before they are counted)
+            ts_arr = rep_df[time_step_col].to_numpy()
+            if not (len(ts_arr) == m and pd.api.types.is_integer_dtype(ts_arr.dtype) and
+                    (ts_arr >= 1).all() and (ts_arr <= m).all() and
+                    (np.bincount(ts_arr - 1, minlength = m) == 1).all()):
+                raise Exception('{} has incorrect timesteps'.format(cur_file))
+
+            # The metric column needs to hold numbers
+            try:
+                rep_values = rep_df[metric_col].to_numpy(dtype = 'float64')
+            except (TypeError, ValueError):
+                raise Exception('{} needs to hold int or float values in metric_col'.format(cur_file))
+
+            # Order the metric values by timestep
+            metric_values = np.empty(m, dtype = 'float64')
+            metric_values[ts_arr - 1] = rep_values
+
+        acc.add_replication(metric_values)
+
+    return acc
@@ -0,0 +1,217 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+import sqlite3
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from quote_sqlite_ident import quote_sqlite_ident
+from welch_procedure_helpers import check_welch_plot_args
+from welch_result import WelchResult
+#-----------------------------------------------------------
+
+def gen_welch_procedure_plots_from_sqlite(conn: sqlite3.Connection, table: str, rep_col: str, time_step_col: str,
+                                          metric_col: str, n: int, m: int, time_step_units: str,
+                                          units_per_timestep: float, first_timestep_units: float,
+                                          metric_name: str = None, w = None, x_axis_units = True,
+                                          compute_only: bool = False, mark_warmup: bool = False,
+                                          render_mode: str = 'auto', max_plot_points: int = 10000,
+                                          ci_level: float = 95.0, show_ci_band: bool = False):
+
+    """
+    Description:
+
+    This function runs Welch's procedure (Law p.407-409, see gen_welch_procedure_plots) on simulation
+    output held in a table of a SQLite database, which may be far larger than memory. Each row of the
+    table is a combination of replication and timestep, as with the in_df of gen_welch_procedure_plots.
+
+    The work that touches all n x m rows is pushed down to SQLite:
+
+        1. One grouped query over replications returns, for each replication, the number of rows with
+           missing or non-integer values (real values are also allowed for the metric), the row count,
+           and the smallest, largest and number of distinct timesteps. These confirm every replication
+           has exactly m rows covering timesteps 1, 2, ..., m.
+        2. One grouped scan over timesteps stores the count and mean (AVG) of the metric for each
+           timestep in a temporary table with a unique index on timestep.
+        3. One more scan of the table joins each row to its timestep's mean by key lookup and sums the
+           squared deviations from that mean for each timestep (two-pass variance).
+
+    Only the m aggregated timestep rows and n replication summary rows are pulled into Python, where the
+    moving averages, suggested warmup, confidence band and figures are computed exactly as in
+    gen_welch_procedure_plots. The temporary table is dropped before returning.
+
+    Inputs:
+
+        conn (sqlite3.Connection) = An open connection to the SQLite database.
+
+        table (string) = Name of the table holding the simulation output.
+
+        rep_col (string) = Name of the integer column within table holding replication numbers.
+
+        time_step_col (string) = Name of the integer column within table holding timesteps.
+
+        metric_col (string) = Name of the integer or real column within table holding metric values.
+
+        n (int) = The maximum replication number within table.
+
+        m (int) = The maximum timestep within table.
+
+        time_step_units, units_per_timestep, first_timestep_units, metric_name, w, x_axis_units,
+        compute_only, mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band =
+                                     As in gen_welch_procedure_plots.
+
+    Outputs:
+
+        out_lst (List): [fig_0, fig_1, out_lst] as returned by gen_welch_procedure_plots, or a WelchResult
+                        if compute_only is True.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_welch_procedure_plots_from_sqlite.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Confirm User Inputs -----------------------
+    # conn needs to be a SQLite connection
+    if not isinstance(conn, sqlite3.Connection):
+        raise Exception('conn needs to be a sqlite3 Connection')
+
+    # table needs to be a string naming a table in the database
+    if not isinstance(table,str):
+        raise Exception('table needs to be a string')
+    table_cols = [i[1] for i in conn.execute('PRAGMA table_info({})'.format(quote_sqlite_ident(table))).fetchall()]
+    if len(table_cols) == 0:
+        raise Exception('table needs to be the name of a table within the database')
+
+    # The three columns need to be strings naming columns within table
+    for col_name, col in [('rep_col', rep_col), ('time_step_col', time_step_col), ('metric_col', metric_col)]:
+        if not isinstance(col,str):
+            raise Exception('{} needs to be a string'.format(col_name))
+        if not col in table_cols:
+            raise Exception('{} needs to be the name of a column within table'.format(col_name))
+
+    # n and m need to be ints
+    if not isinstance(n,int):
+        raise Exception('n needs to be of type int')
+    if not isinstance(m,int):
+        raise Exception('m needs to be of type int')
+
+    # The plotting arguments need to be valid
+    check_welch_plot_args(time_step_units, units_per_timestep, first_timestep_units, w, x_axis_units, compute_only,
+                          mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band)
+
+    # If provided, metric_name needs to be a string
+    if not metric_name == None:
+        if not isinstance(metric_name,str):
+            raise Exception('metric_name needs to be a string if provided')
+    #------------------ End Confirm User Inputs -------------------
+
+    t_sql = quote_sqlite_ident(table)
+    rep_sql = quote_sqlite_ident(rep_col)
+    ts_sql = quote_sqlite_ident(time_step_col)
+    met_sql = quote_sqlite_ident(metric_col)
+
+    #------------------ Confirm Table Contents -----------------------
+    # One grouped pass over replications: value types, maximums, and the replication/timestep structure
+    rep_rows = conn.execute("""
+        SELECT {rep},
+               SUM(typeof({rep}) <> 'integer' OR typeof({ts}) <> 'integer' OR
+                   typeof({met}) NOT IN ('integer', 'real')),
+               COUNT(*), MIN({ts}), MAX({ts}), COUNT(DISTINCT {ts})
+        FROM {t}
+        GROUP BY {rep}
+        ORDER BY {rep}
+        """.format(rep = rep_sql, ts = ts_sql, met = met_sql, t = t_sql)).fetchall()
+
+    # The table needs rows
+    if len(rep_rows) == 0:
+        raise Exception('table needs to hold at least one row')
+
+    # The columns need to be fully populated (NULL has type 'null') with integer (or real metric) values
+    if any(i[1] > 0 for i in rep_rows):
+        raise Exception('rep_col and time_step_col need to be fully populated integer columns and metric_col '
+                        'a fully populated integer or real column')
+
+    # n needs to be the maximum replication
+    if not n == rep_rows[-1][0]:
+        raise Exception('n needs to be the maximum replication number in table')
+
+    # m needs to be the maximum timestep
+    if not m == max(i[4] for i in rep_rows):
+        raise Exception('m needs to be the maximum timestep within table')
+
+    # make sure the replication numbers are correct
+    for cur_rep, _, num_rows, _, _, _ in rep_rows:
+        if not num_rows == m:
+            raise Exception("table has the wrong number of rows for replication {}".format(cur_rep))
+
+    # make sure the timesteps are correct
+    for cur_rep, _, _, min_ts, max_ts, num_ts in rep_rows:
+        if not (min_ts >= 1 and max_ts <= m and num_ts == m):
+            raise Exception("table has incorrect timesteps for replication {}".format(cur_rep))
+    #------------------ End Confirm Table Contents -------------------
+
+    reps = np.array([i[0] for i in rep_rows])
+
+    # Count, mean and squared deviations from the mean by timestep (two-pass variance, which avoids the
+    # cancellation of SUM(x*x) - COUNT(x) * AVG(x)^2). The means are indexed by timestep so the second pass
+    # looks each row's mean up instead of scanning every timestep for every row.
+    create_lst, select_sql, drop_sql = _timestep_stats_sql(t_sql, ts_sql, met_sql)
+    conn.execute(drop_sql)
+    try:
+        for cur_sql in create_lst:
+            conn.execute(cur_sql)
+        ts_rows = conn.execute(select_sql).fetchall()
+    finally:
+        conn.execute(drop_sql)
+
+    timestep_counts = np.array([i[1] for i in ts_rows], dtype = 'float64')
+    timestep_means = np.array([i[2] for i in ts_rows], dtype = 'float64')
+    timestep_sq_devs = np.array([i[3] for i in ts_rows], dtype = 'float64')
+
+    # Variance across replications by timestep (undefined for a single replication)
+    if len(reps) > 1:
+        timestep_vars = timestep_sq_devs / (timestep_counts - 1.0)
+    else:
+        timestep_vars = np.full(m, np.nan)
+
+    # Compute moving averages and x coordinates
+    result = WelchResult(reps, timestep_means, w, time_step_units, units_per_timestep, first_timestep_units,
+                         metric_name, x_axis_units, mark_warmup, render_mode, max_plot_points,
+                         timestep_vars = timestep_vars, ci_level = ci_level, show_ci_band = show_ci_band)
+
+    # Return the result object, or build figures and output list
+    if compute_only:
+        return result
+    else:
+        return result.to_plot_lst()
+
+
+def _timestep_stats_sql(t_sql: str, ts_sql: str, met_sql: str) -> list:
+
+    """
+    Returns [create_lst, select_sql, drop_sql]: the statements that store the count and mean of the metric by
+    timestep in a temporary table indexed by timestep, the query selecting each timestep's count, mean and
+    squared deviations from the mean, and the statement dropping the temporary table.
+    """
+
+    create_lst = ["""
+                  CREATE TEMP TABLE welch_ts_avg AS
+                  SELECT {ts} AS ts, COUNT(*) AS cnt, AVG({met}) AS mu FROM {t} GROUP BY {ts}
+                  """.format(ts = ts_sql, met = met_sql, t = t_sql),
+                  'CREATE UNIQUE INDEX temp.welch_ts_avg_ts ON welch_ts_avg (ts)']
+
+    select_sql = """
+        SELECT ts_avg.ts, ts_avg.cnt, ts_avg.mu, SUM(({met} - ts_avg.mu) * ({met} - ts_avg.mu))
+        FROM {t} CROSS JOIN temp.welch_ts_avg AS ts_avg ON ts_avg.ts = {t}.{ts}
+        GROUP BY ts_avg.ts
+        ORDER BY ts_avg.ts
+        """.format(ts = ts_sql, met = met_sql, t = t_sql)
+
+    return [create_lst, select_sql, 'DROP TABLE IF EXISTS temp.welch_ts_avg']
@@ -0,0 +1,229 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+import math
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from welch_procedure_helpers import compute_moving_avgs, check_welch_plot_args
+from welch_result import WelchResult
+#-----------------------------------------------------------
+
+class WelchAccumulator:
+
+    """
+    Description:
+
+    The purpose of this class is to run Welch's procedure (Law p.407-409, see gen_welch_procedure_plots)
+    while simulation replications are still being produced. Rather than holding every replication and
+    timestep in a DataFrame, the accumulator keeps a running sum of the metric, a count of
+    contributing replications and a running sum of squared deviations from the mean (Welford's update)
+    for each of the m timesteps. Memory use is O(m) and does not grow with the number of replications n.
+
+    Replications are added one at a time with add_replication. Each replication is given as an array
+    of metric values ordered by timestep (index 0 is timestep 1). A replication that is still running
+    can be passed with fewer than m values; the later timesteps then have fewer contributing
+    replications until the rest of the run is added by calling add_replication again with
+    start_timestep set to the first timestep not yet added. This continues the most recently added
+    replication (it is not counted as a new replication). Timestep means, moving averages and the
+    Welch's procedure figures can be requested at any time.
+
+    Inputs:
+
+        m (int) = The number of timesteps in each replication.
+
+    Methods:
+
+        add_replication(metric_values, start_timestep = 1) = Adds one replication's metric values (list,
+                                         NumPy array or Pandas Series of int or float, fully populated,
+                                         length 1 to m) to the running sums, counts and squared
+                                         deviations. With start_timestep > 1, the values are timesteps
+                                         start_timestep, start_timestep + 1, ... of the most recently
+                                         added replication, continuing it from where it stopped.
+
+        merge(other) = Adds the running sums and counts of another WelchAccumulator with the same m
+                       (e.g., one filled by a worker process) into this accumulator. Squared deviations
+                       are combined with the parallel formula of Chan et al.
+
+        get_timestep_means() = Returns a NumPy array with the metric mean over replications for each
+                               timestep that at least one replication has reached.
+
+        get_timestep_vars() = Returns a NumPy array with the metric variance (n-1 denominator) over
+                              replications for the same timesteps as get_timestep_means (NaN where
+                              only one replication has contributed).
+
+        get_moving_avgs(w) = Returns the moving averages of the timestep means for window w (int), or a
+                             list of arrays if w is a list of ints. w defaults to floor(# timesteps / 4).
+
+        gen_plots(time_step_units, units_per_timestep, first_timestep_units, metric_name, w,
+                  x_axis_units, compute_only, mark_warmup, render_mode, max_plot_points, ci_level,
+                  show_ci_band) = Returns [fig_0, fig_1, out_lst] exactly as
+                                  gen_welch_procedure_plots does for the replications added so far, or a
+                                  WelchResult if compute_only is True. Replications are numbered
+                                  1, 2, ..., n in the order they were added.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_welch_accumulator.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    def __init__(self, m: int):
+
+        # m needs to be a positive int
+        if not (isinstance(m,int) and m > 0):
+            raise Exception('m needs to be a positive int')
+
+        self.m = m
+        self.n = 0
+        self.timestep_sums = np.zeros(m, dtype = 'float64')
+        self.timestep_counts = np.zeros(m, dtype = 'int64')
+        self.timestep_sq_devs = np.zeros(m, dtype = 'float64')
+
+        # Number of timesteps the most recently added replication has reached (None if it can't be continued)
+        self._last_rep_m = None
+
+    def add_replication(self, metric_values, start_timestep: int = 1) -> None:
+
+        # start_timestep needs to be an int between 1 and m
+        if not (isinstance(start_timestep,int) and 1 <= start_timestep <= self.m):
+            raise Exception('start_timestep needs to be an int between 1 and m')
+
+        # A continuation needs to start right after the last timestep of the most recently added replication
+        if start_timestep > 1 and not start_timestep - 1 == self._last_rep_m:
+            raise Exception('start_timestep needs to be the timestep after the last one added for the most '
+                            'recently added replication')
+
+        # Convert to a 1-D float64 array without copying when possible
+        try:
+            wrk_values = np.asarray(metric_values, dtype = 'float64')
+        except (TypeError, ValueError):
+            raise Exception('metric_values needs to hold int or float values')
+
+        # metric_values needs to be one dimensional
+        if not wrk_values.ndim == 1:
+            raise Exception('metric_values needs to be one dimensional')
+
+        # metric_values needs to have between 1 and m values (ending by timestep m)
+        if not (1 <= len(wrk_values) <= self.m - start_timestep + 1):
+            raise Exception('metric_values needs to have between 1 and m values')
+
+        # metric_values needs to be fully populated
+        if not np.isfinite(wrk_values).all():
+            raise Exception('metric_values needs to be fully populated with finite values')
+
+        # Add to the running sums, counts and squared deviations of the timesteps covered (Welford's update)
+        num_ts = len(wrk_values)
+        ts_slice = slice(start_timestep - 1, start_timestep - 1 + num_ts)
+        old_counts = self.timestep_counts[ts_slice]
+        old_means = np.divide(self.timestep_sums[ts_slice], old_counts, out = np.zeros(num_ts),
+                              where = old_counts > 0)
+        self.timestep_sums[ts_slice] += wrk_values
+        self.timestep_counts[ts_slice] += 1
+        new_means = self.timestep_sums[ts_slice] / self.timestep_counts[ts_slice]
+        self.timestep_sq_devs[ts_slice] += (wrk_values - old_means) * (wrk_values - new_means)
+
+        # A continuation adds timesteps to the same replication
+        if start_timestep == 1:
+            self.n = self.n + 1
+        self._last_rep_m = start_timestep - 1 + num_ts
+
+    def merge(self, other) -> None:
+
+        # other needs to be a WelchAccumulator with the same m
+        if not isinstance(other, WelchAccumulator):
+            raise Exception('other needs to be a WelchAccumulator')
+        if not other.m == self.m:
+            raise Exception('other needs to have the same m')
+
+        # Combine the squared deviations (Chan et al.), then the running sums and counts
+        total_counts = self.timestep_counts + other.timestep_counts
+        both = (self.timestep_counts > 0) & (other.timestep_counts > 0)
+        self_means = np.divide(self.timestep_sums, self.timestep_counts, out = np.zeros(self.m), where = both)
+        other_means = np.divide(other.timestep_sums, other.timestep_counts, out = np.zeros(self.m), where = both)
+        cross_counts = np.divide(self.timestep_counts * other.timestep_counts, total_counts,
+                                 out = np.zeros(self.m), where = both)
+        self.timestep_sq_devs += other.timestep_sq_devs + (((other_means - self_means) ** 2) * cross_counts)
+
+        self.timestep_sums += other.timestep_sums
+        self.timestep_counts += other.timestep_counts
+        self.n = self.n + other.n
+
+        # The most recently added replication is no longer known after a merge
+        self._last_rep_m = None
+
+    def get_timestep_means(self) -> np.ndarray:
+
+        # At least one replication is needed
+        if self.n == 0:
+            raise Exception('At least one replication needs to be added')
+
+        # Timesteps reached by at least one replication (replications always start at timestep 1)
+        m_reached = int(np.count_nonzero(self.timestep_counts))
+
+        return self.timestep_sums[:m_reached] / self.timestep_counts[:m_reached]
+
+    def get_timestep_vars(self) -> np.ndarray:
+
+        # At least one replication is needed
+        if self.n == 0:
+            raise Exception('At least one replication needs to be added')
+
+        m_reached = int(np.count_nonzero(self.timestep_counts))
+        counts = self.timestep_counts[:m_reached]
+
+        return np.divide(self.timestep_sq_devs[:m_reached], counts - 1, out = np.full(m_reached, np.nan),
+                         where = counts > 1)
+
+    def get_moving_avgs(self, w = None):
+
+        timestep_means = self.get_timestep_means()
+
+        # If needed, compute w
+        if w == None:
+            w = math.floor(len(timestep_means)/4)
+
+        # w needs to be an int or a list of ints
+        if isinstance(w,list):
+            if len(w) == 0 or not all(isinstance(i,int) for i in w):
+                raise Exception('w needs to be an int or a non-empty list of ints')
+            return compute_moving_avgs(timestep_means, w)
+        elif isinstance(w,int):
+            return compute_moving_avgs(timestep_means, [w])[0]
+        else:
+            raise Exception('w needs to be an int or a non-empty list of ints')
+
+    def gen_plots(self, time_step_units: str, units_per_timestep: float, first_timestep_units: float,
+                  metric_name: str = None, w = None, x_axis_units = True, compute_only: bool = False,
+                  mark_warmup: bool = False, render_mode: str = 'auto', max_plot_points: int = 10000,
+                  ci_level: float = 95.0, show_ci_band: bool = False):
+
+        #------------------ Confirm User Inputs -----------------------
+        # The plotting arguments need to be valid
+        check_welch_plot_args(time_step_units, units_per_timestep, first_timestep_units, w, x_axis_units,
+                              compute_only, mark_warmup, render_mode, max_plot_points, ci_level, show_ci_band)
+
+        # If provided, metric_name needs to be a string
+        if not metric_name == None:
+            if not isinstance(metric_name,str):
+                raise Exception('metric_name needs to be a string if provided')
+        #------------------ End Confirm User Inputs -------------------
+
+        timestep_means = self.get_timestep_means()
+        result = WelchResult(np.arange(1, self.n + 1), timestep_means, w, time_step_units,
+                             units_per_timestep, first_timestep_units, metric_name, x_axis_units, mark_warmup,
+                             render_mode, max_plot_points, timestep_vars = self.get_timestep_vars(),
+                             timestep_counts = self.timestep_counts[:len(timestep_means)],
+                             ci_level = ci_level, show_ci_band = show_ci_band)
+
+        # Return the result object, or build figures and output list
+        if compute_only:
+            return result
+        else:
+            return result.to_plot_lst()
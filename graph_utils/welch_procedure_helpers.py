@@ -0,0 +1,365 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from gen_lttb_downsample import gen_lttb_downsample
+#-----------------------------------------------------------
+
+# Shared building blocks for the Welch's procedure functions in graph_utils (gen_welch_procedure_plots,
+# WelchAccumulator, WelchResult, ...). Each caller is responsible for checking user inputs before calling these;
+# check_welch_plot_args checks the plotting arguments the entry points share.
+
+def check_welch_plot_args(time_step_units: str, units_per_timestep: float, first_timestep_units: float, w,
+                          x_axis_units, compute_only: bool, mark_warmup: bool, render_mode: str,
+                          max_plot_points: int, ci_level: float, show_ci_band: bool) -> None:
+
+    """
+    Raises the user input errors of the plotting arguments shared by the Welch's procedure entry points
+    (see gen_welch_procedure_plots for their meaning), so every entry point checks them the same way and
+    can do so before any data is read.
+    """
+
+    # time_step_units needs to be a string
+    if not isinstance(time_step_units,str):
+        raise Exception('time_step_units needs to be of type str')
+
+    # units_per_timestep needs to be a float
+    if not isinstance(units_per_timestep,float):
+        raise Exception('units_per_timestep needs to be a float')
+
+    # first_timestep_units needs to be a float
+    if not isinstance(first_timestep_units,float):
+        raise Exception('first_timestep_units needs to be a float')
+
+    # if w is provided it needs to be an int (or a list of ints)
+    if not w == None:
+        if isinstance(w,list):
+            if len(w) == 0:
+                raise Exception('w needs to be a non-empty list if provided as a list')
+            for i in w:
+                if not isinstance(i,int):
+                    raise Exception('Each entry in w needs to be an int')
+        elif not isinstance(w,int):
+            raise Exception('w needs to be an int if provided')
+
+    # x_axis_units needs to be a boolean
+    if not isinstance(x_axis_units,bool):
+        raise Exception('x_axis_units needs to be a bool')
+
+    # compute_only needs to be a boolean
+    if not isinstance(compute_only,bool):
+        raise Exception('compute_only needs to be a bool')
+
+    # mark_warmup needs to be a boolean
+    if not isinstance(mark_warmup,bool):
+        raise Exception('mark_warmup needs to be a bool')
+
+    # render_mode needs to be 'auto', 'svg' or 'webgl'
+    if not render_mode in ['auto', 'svg', 'webgl']:
+        raise Exception("render_mode needs to be 'auto', 'svg' or 'webgl'")
+
+    # max_plot_points needs to be an int of at least 3
+    if not (isinstance(max_plot_points,int) and max_plot_points >= 3):
+        raise Exception('max_plot_points needs to be an int of at least 3')
+
+    # ci_level needs to be a float between 0 and 100
+    if not (isinstance(ci_level,float) and 0.0 < ci_level < 100.0):
+        raise Exception('ci_level needs to be a float between 0.0 and 100.0')
+
+    # show_ci_band needs to be a boolean
+    if not isinstance(show_ci_band,bool):
+        raise Exception('show_ci_band needs to be a bool')
+
+
+def check_rep_timestep_structure(rep_arr: np.ndarray, ts_arr: np.ndarray, m: int) -> np.ndarray:
+
+    """
+    Confirms, with a bincount over the replication codes and a hit mask over the (replication, timestep)
+    cells, that every replication has exactly m rows and that those rows cover timesteps 1, 2, ..., m once each. When several replications
+    are wrong, the one named in the error is the first offending one in order of appearance.
+
+    Returns the position of each row within the row-major n x m matrix with one row per replication
+    (in sorted order) and one column per timestep. The positions are built in place in the int64 array
+    of replication codes, so checking and placing the rows share one int64 value per row.
+    """
+
+    # Number each replication in sorted order
+    rep_codes, rep_uniques = pd.factorize(rep_arr, sort = True)
+    num_reps = len(rep_uniques)
+
+    # Replication named in an error: the first offending one in order of appearance
+    def first_bad_rep(bad_rep_mask):
+        bad_set = set(rep_uniques[bad_rep_mask].tolist())
+        return int(next(i for i in pd.unique(rep_arr).tolist() if i in bad_set))
+
+    # make sure the replication numbers are correct
+    bad_rep_mask = np.bincount(rep_codes, minlength = num_reps) != m
+    if bad_rep_mask.any():
+        raise Exception("in_df has the wrong number of rows for replication {}".format(first_bad_rep(bad_rep_mask)))
+
+    # make sure the timesteps are within 1, ..., m
+    out_range = ts_arr < 1
+    np.logical_or(out_range, ts_arr > m, out = out_range)
+    if out_range.any():
+        bad_rep_mask = np.bincount(rep_codes[out_range], minlength = num_reps) > 0
+        raise Exception("in_df has incorrect timesteps for replication {}".format(first_bad_rep(bad_rep_mask)))
+    del out_range
+
+    # Position of each row (replication code * m + timestep - 1), built in place
+    cell_idx = rep_codes.astype('int64', copy = False)
+    cell_idx *= m
+    np.add(cell_idx, ts_arr, out = cell_idx, casting = 'unsafe')
+    cell_idx -= 1
+
+    # Each replication has m rows within range, so its timesteps are 1, ..., m exactly when every one of
+    # its cells is hit
+    cell_hit = np.zeros(num_reps * m, dtype = 'bool')
+    cell_hit[cell_idx] = True
+    bad_rep_mask = ~cell_hit.reshape(num_reps, m).all(axis = 1)
+    if bad_rep_mask.any():
+        raise Exception("in_df has incorrect timesteps for replication {}".format(first_bad_rep(bad_rep_mask)))
+
+    return cell_idx
+
+
+def compute_moving_avgs(timestep_means: np.ndarray, w_lst: list) -> list:
+
+    """
+    Computes Welch's moving averages (Law p.408) for timesteps 1, 2, ..., m-w for every window in
+    w_lst. All windows share one prefix sum of the timestep means, so each window costs O(m). For
+    t <= w the window is the first 2t-1 timestep means, otherwise it is the 2w+1 means centered on t.
+    Returns one NumPy array per window, in the order of w_lst.
+    """
+
+    m = len(timestep_means)
+    wrk_means = np.asarray(timestep_means, dtype = 'float64')
+
+    # Prefix sums of the timestep means with a leading 0.0 (length m+1). A non-finite mean would spread
+    # to every later prefix sum, so those are summed as 0.0 and counted separately instead.
+    finite_mask = np.isfinite(wrk_means)
+    all_finite = bool(finite_mask.all())
+    ts_mean_cumsum = np.concatenate(([0.0], np.cumsum(np.where(finite_mask, wrk_means, 0.0))))
+    if not all_finite:
+        pos_inf_cumsum = np.concatenate(([0], np.cumsum(wrk_means == np.inf)))
+        neg_inf_cumsum = np.concatenate(([0], np.cumsum(wrk_means == -np.inf)))
+        nan_cumsum = np.concatenate(([0], np.cumsum(np.isnan(wrk_means))))
+
+    moving_avgs_lst = []
+    for w in w_lst:
+
+        # Timesteps that get a moving average
+        t = np.arange(1, m - w + 1)
+
+        # Prefix sum bounds of each window
+        lo = np.where(t <= w, 0, t - w - 1)
+        hi = np.where(t <= w, (2 * t) - 1, t + w)
+
+        cur_avgs = (ts_mean_cumsum[hi] - ts_mean_cumsum[lo]) / (hi - lo)
+
+        # Windows holding inf, -inf or NaN means average to what np.mean would give
+        if not all_finite:
+            num_pos = pos_inf_cumsum[hi] - pos_inf_cumsum[lo]
+            num_neg = neg_inf_cumsum[hi] - neg_inf_cumsum[lo]
+            num_nan = nan_cumsum[hi] - nan_cumsum[lo]
+            cur_avgs[num_pos > 0] = np.inf
+            cur_avgs[num_neg > 0] = -np.inf
+            cur_avgs[(num_nan > 0) | ((num_pos > 0) & (num_neg > 0))] = np.nan
+
+        moving_avgs_lst.append(cur_avgs)
+
+    return moving_avgs_lst
+
+
+def compute_plot_x(m: int, x_axis_units: bool, first_timestep_units: float, units_per_timestep: float) -> np.ndarray:
+
+    """
+    Returns the x coordinates for timesteps 1, 2, ..., m. In units, timestep 1 sits at first_timestep_units
+    and each later timestep adds units_per_timestep (accumulated in order, as a running sum would).
+    Otherwise the coordinates are the timestep numbers as floats.
+    """
+
+    if x_axis_units:
+        steps = np.full(m, float(units_per_timestep))
+        if m > 0:
+            steps[0] = float(first_timestep_units)
+        return np.cumsum(steps)
+    else:
+        return np.arange(1, m + 1, dtype = 'float64')
+
+
+def build_welch_figures(plot_x, timestep_means, w_lst: list, plot_x_2_lst: list,
+                        moving_avgs_lst: list, n: int, time_step_units: str, metric_name: str = None,
+                        x_axis_units: bool = True, warmup_x: float = None, render_mode: str = 'auto',
+                        max_plot_points: int = 10000, ci_lower = None, ci_upper = None) -> list:
+
+    """
+    Builds the two Welch's procedure Plotly figures. The index 0 figure plots the timestep means
+    and the index 1 figure plots one moving-average trace per window in w_lst. If warmup_x is given,
+    a dashed vertical line marks the end of the warmup period on both figures.
+
+    render_mode 'svg' draws every point with go.Scatter. 'webgl' draws with go.Scattergl and reduces
+    each trace to at most max_plot_points points with LTTB downsampling (see gen_lttb_downsample).
+    'auto' uses 'webgl' when any trace has more than max_plot_points points and 'svg' otherwise. Only
+    the plotted points are reduced; the arrays passed in are not modified.
+
+    If ci_lower and ci_upper are given, they are drawn as a shaded band behind the timestep means on
+    the index 0 figure, using the same plotted points as the means.
+    """
+
+    # Choose the trace type
+    longest_trace = max([len(plot_x)] + [len(i) for i in plot_x_2_lst])
+    use_webgl = render_mode == 'webgl' or (render_mode == 'auto' and longest_trace > max_plot_points)
+    if use_webgl:
+        scatter_type = go.Scattergl
+        trace_mode = 'lines'
+    else:
+        scatter_type = go.Scatter
+        trace_mode = 'lines+markers'
+
+    # Indices of the points to plot for a trace (downsampled with LTTB for webgl)
+    def plot_idx(x, y):
+        if use_webgl and len(x) > max_plot_points:
+            return gen_lttb_downsample(x, y, max_plot_points)
+        return np.arange(len(x))
+
+    # Get name for metric
+    if not metric_name == None:
+        metric_n = metric_name
+    else:
+        metric_n = "Metric"
+
+    #----------------------- Build index 0 chart -----------------------------
+    # Create figure
+    fig_0 = go.Figure()
+
+    plot_x = np.asarray(plot_x)
+    timestep_means = np.asarray(timestep_means)
+    keep_idx = plot_idx(plot_x, timestep_means)
+
+    # Add the confidence band behind the means
+    if not (ci_lower is None or ci_upper is None):
+        fig_0.add_trace(scatter_type(x = plot_x[keep_idx], y = np.asarray(ci_upper)[keep_idx], mode = 'lines',
+                                     line = dict(width = 0), showlegend = False, name = 'CI upper'))
+        fig_0.add_trace(scatter_type(x = plot_x[keep_idx], y = np.asarray(ci_lower)[keep_idx], mode = 'lines',
+                                     line = dict(width = 0), fill = 'tonexty', fillcolor = 'rgba(99, 110, 250, 0.2)',
+                                     showlegend = False, name = 'CI lower'))
+
+    # Add data to plot
+    fig_0.add_trace(scatter_type(x = plot_x[keep_idx], y = timestep_means[keep_idx], mode = trace_mode))
+
+    # Add Title
+    fig_0.update_layout(title = {'text': '{} Mean over Replications by Timestep'.format(metric_n),
+                                 'font': {'size': 30}, 'x': 0.5})
+
+    # Add Y-Axis Label
+    fig_0.update_layout(yaxis_title = "{} Mean over {} Replications".format(metric_n,n),
+                        yaxis_title_font = dict(size = 25))
+    #----------------------- End build index 0 chart ------------------------
+
+    #----------------------- Build index 1 chart -----------------------------
+    # Create figure
+    fig_1 = go.Figure()
+
+    # Add data to plot (one trace per window)
+    for cur_w, plot_x_2, moving_avgs in zip(w_lst, plot_x_2_lst, moving_avgs_lst):
+        plot_x_2 = np.asarray(plot_x_2)
+        moving_avgs = np.asarray(moving_avgs)
+        keep_idx = plot_idx(plot_x_2, moving_avgs)
+        fig_1.add_trace(scatter_type(x = plot_x_2[keep_idx], y = moving_avgs[keep_idx], mode = trace_mode,
+                                     name = 'w = {}'.format(cur_w)))
+
+    # Add Title
+    fig_1.update_layout(title = {'text': 'Moving Average of Timestep Mean {} by Timestep'.format(metric_n),
+                                 'font': {'size': 30}, 'x': 0.5})
+
+    # Add Y-Axis Label
+    fig_1.update_layout(yaxis_title = "Moving Average",
+                        yaxis_title_font = dict(size = 25))
+    #----------------------- End build index 1 chart -----------------------------
+
+    # Common formatting for both charts
+    for fig in [fig_0, fig_1]:
+
+        # Add X-Axis Label
+        if x_axis_units:
+            fig.update_layout(xaxis_title = time_step_units,
+                              xaxis_title_font = dict(size = 25))
+        else:
+            fig.update_layout(xaxis_title = "Timestep",
+                              xaxis_title_font = dict(size = 25))
+
+        # Set x-axis tick size and tick standoff
+        fig.update_layout(xaxis = dict(tickfont = dict(size = 20)))
+        fig.update_xaxes(ticklabelstandoff = 10)
+
+        # Set y-axis tick size and tick standoff
+        fig.update_layout(yaxis = dict(tickfont = dict(size = 20)))
+        fig.update_yaxes(ticklabelstandoff = 10)
+
+        # Lock Axes
+        fig.update_xaxes(fixedrange = True)
+        fig.update_yaxes(fixedrange = True)
+
+        # Set figure size
+        fig.update_layout(width = 900, height = 600)
+
+        # Mark the end of the warmup period
+        if not warmup_x == None:
+            fig.add_vline(x = warmup_x, line_dash = 'dash', line_color = 'red',
+                          annotation_text = 'Suggested warmup', annotation_position = 'top right')
+
+    return [fig_0, fig_1]
+
+
+def build_correlogram_figure(acf: np.ndarray, n_obs: int, metric_name: str = None, z: float = 1.959963985):
+
+    """
+    Builds the correlogram of the autocorrelations acf (lags 0, 1, ...) as a bar chart, with dashed lines
+    at +/- z / sqrt(n_obs), the approximate bounds the sample autocorrelations of n_obs independent
+    observations stay within (z of 1.96 gives 95% bounds).
+    """
+
+    # Get name for metric
+    if not metric_name == None:
+        metric_n = metric_name
+    else:
+        metric_n = "Metric"
+
+    # Create figure
+    fig = go.Figure()
+
+    # Add data to plot
+    fig.add_trace(go.Bar(x = np.arange(len(acf)), y = np.asarray(acf), name = 'Autocorrelation'))
+
+    # Add bounds for independent observations
+    bound = z / np.sqrt(n_obs)
+    for cur_bound in [bound, -bound]:
+        fig.add_hline(y = cur_bound, line_dash = 'dash', line_color = 'red')
+
+    # Add Title
+    fig.update_layout(title = {'text': 'Correlogram of {}'.format(metric_n), 'font': {'size': 30}, 'x': 0.5})
+
+    # Add axis labels
+    fig.update_layout(xaxis_title = "Lag", xaxis_title_font = dict(size = 25))
+    fig.update_layout(yaxis_title = "Autocorrelation", yaxis_title_font = dict(size = 25))
+
+    # Set tick size and tick standoff
+    fig.update_layout(xaxis = dict(tickfont = dict(size = 20)), yaxis = dict(tickfont = dict(size = 20)))
+    fig.update_xaxes(ticklabelstandoff = 10)
+    fig.update_yaxes(ticklabelstandoff = 10)
+
+    # Lock Axes
+    fig.update_xaxes(fixedrange = True)
+    fig.update_yaxes(fixedrange = True)
+
+    # Set figure size
+    fig.update_layout(width = 900, height = 600)
+
+    return fig
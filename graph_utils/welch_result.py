@@ -0,0 +1,333 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+import math
+from scipy.stats import norm
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from welch_procedure_helpers import compute_moving_avgs, compute_plot_x, build_welch_figures, build_correlogram_figure
+from gen_mser_warmup import gen_mser_warmup
+from gen_fft_autocorrelation import gen_fft_autocorrelation
+from gen_replication_deletion_ci import gen_replication_deletion_ci
+#-----------------------------------------------------------
+
+class WelchResult:
+
+    """
+    Description:
+
+    The purpose of this class is to hold the computed output of Welch's procedure (Law p.407-409, see
+    gen_welch_procedure_plots) as NumPy arrays without building any figures. It is returned by the
+    Welch's procedure functions when compute_only is True. The two Plotly figures are only built, once,
+    when gen_figures is called, and to_plot_lst gives the [fig_0, fig_1, out_lst] return value of
+    gen_welch_procedure_plots for callers that need the list form.
+
+    Inputs:
+
+        reps (list or NumPy array) = The replication numbers, in increasing order.
+
+        timestep_means (NumPy array) = The metric mean over replications for timesteps 1, 2, ..., m.
+
+        w (int or list) = The moving-average window(s). None defaults to floor(m/4).
+
+        time_step_units, units_per_timestep, first_timestep_units, metric_name, x_axis_units =
+                                     As in gen_welch_procedure_plots. Used for the x coordinates and
+                                     the figures.
+
+        mark_warmup (bool) = (Optional) True marks warmup_l on both figures. Defaults to False
+
+        render_mode (string) = (Optional) 'auto', 'svg' or 'webgl'. See gen_welch_procedure_plots.
+                               Defaults to 'auto'
+
+        max_plot_points (int) = (Optional) Most points drawn per trace in webgl mode. Defaults to 10000
+
+        timestep_vars (NumPy array) = (Optional) Sample variance (n-1 denominator) of the metric across
+                                      replications for each timestep. Needed for the confidence band.
+
+        timestep_counts (NumPy array) = (Optional) Number of replications behind each timestep mean.
+                                        Defaults to the number of replications for every timestep.
+
+        ci_level (float) = (Optional) Approximate confidence level, as a percentage, of the per-timestep
+                           confidence band. Defaults to 95.0
+
+        show_ci_band (bool) = (Optional) True draws the confidence band on the index 0 figure. Defaults
+                              to False
+
+        rep_matrix (NumPy array) = (Optional) The n x m matrix of metric values, one row per replication
+                                   in the order of reps. Needed for per-replication autocorrelations.
+
+    Attributes:
+
+        reps (NumPy array) = Replication numbers
+
+        timesteps (NumPy array) = Timesteps 1, 2, ..., m
+
+        timestep_means (NumPy array) = Metric mean over replications by timestep
+
+        w (int or list) = Moving-average window(s)
+
+        moving_avgs (NumPy array or list) = Moving averages for timesteps 1 to m-w (one array per
+                                            window if w is a list)
+
+        plot_x (NumPy array) = x coordinates for the index 0 figure
+
+        plot_x_2 (NumPy array or list) = x coordinates for the index 1 figure (one array per window if
+                                         w is a list)
+
+        warmup_l (int or None) = Suggested warmup length in timesteps from the MSER-5 rule (see
+                                 gen_mser_warmup), computed when first requested. None if the timestep
+                                 means are not all finite (e.g., a metric holding inf values).
+
+        timestep_vars (NumPy array or None) = Variance across replications by timestep
+
+        ci_lower, ci_upper (NumPy array or None) = Large-sample confidence band for each timestep mean,
+                                                   mean -/+ z * sqrt(variance / replications) (see
+                                                   stats_utils/gen_large_sample_ci_pop_mean). None when
+                                                   timestep_vars is not given.
+
+        rep_matrix (NumPy array or None) = Metric values by replication (row) and timestep (column)
+
+    Methods:
+
+        gen_figures() = Returns [fig_0, fig_1], building them on the first call.
+
+        to_out_lst() = Returns the index 2 out_lst of gen_welch_procedure_plots built from the attributes.
+
+        to_plot_lst() = Returns [fig_0, fig_1, out_lst] as gen_welch_procedure_plots does.
+
+        gen_autocorrelation(max_lag = None, warmup_l = None, per_replication = False) = Returns the
+                                     autocorrelations for lags 0, 1, ..., max_lag (see
+                                     gen_fft_autocorrelation) of the timestep means, or of each
+                                     replication's series pooled together if per_replication is True,
+                                     after deleting the first warmup_l timesteps. warmup_l defaults to the
+                                     suggested warmup_l attribute. max_lag defaults to the smaller of 100
+                                     and the number of timesteps left - 1.
+
+        gen_correlogram(max_lag = None, warmup_l = None, per_replication = False) = Returns a bar chart
+                                     of the same autocorrelations, with the approximate ci_level bounds
+                                     for independent observations.
+
+        gen_replication_deletion_ci(warmup_l = None) = Returns the replication/deletion confidence
+                                     interval(s) of the steady-state mean at ci_level for one warmup
+                                     length or a list of candidates (see gen_replication_deletion_ci).
+                                     warmup_l defaults to the suggested warmup_l attribute. Needs
+                                     rep_matrix.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_welch_result.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    def __init__(self, reps, timestep_means: np.ndarray, w, time_step_units: str, units_per_timestep: float,
+                 first_timestep_units: float, metric_name: str = None, x_axis_units: bool = True,
+                 mark_warmup: bool = False, render_mode: str = 'auto', max_plot_points: int = 10000,
+                 timestep_vars: np.ndarray = None, timestep_counts: np.ndarray = None, ci_level: float = 95.0,
+                 show_ci_band: bool = False, rep_matrix: np.ndarray = None):
+
+        m = len(timestep_means)
+
+        self.reps = np.asarray(reps)
+        self.timesteps = np.arange(1, m + 1)
+        self.timestep_means = np.asarray(timestep_means, dtype = 'float64')
+
+        # If needed, compute w
+        if w == None:
+            w = math.floor(m/4)
+        self.w = w
+
+        # Work with a list of windows so a single w and several w share the same code
+        if isinstance(w,list):
+            w_lst = w
+        else:
+            w_lst = [w]
+
+        # Compute moving averages and x coordinates
+        moving_avgs_lst = compute_moving_avgs(self.timestep_means, w_lst)
+        self.plot_x = compute_plot_x(m, x_axis_units, first_timestep_units, units_per_timestep)
+        plot_x_2_lst = [self.plot_x[:max(m - cur_w, 0)] for cur_w in w_lst]
+
+        if isinstance(w,list):
+            self.moving_avgs = moving_avgs_lst
+            self.plot_x_2 = plot_x_2_lst
+        else:
+            self.moving_avgs = moving_avgs_lst[0]
+            self.plot_x_2 = plot_x_2_lst[0]
+
+        # The suggested warmup length is computed the first time it is requested (see warmup_l)
+        self._warmup_l = None
+        self._warmup_l_done = False
+
+        # Per-timestep confidence band from the variance across replications
+        if timestep_vars is None:
+            self.timestep_vars = None
+            self.ci_lower = None
+            self.ci_upper = None
+        else:
+            self.timestep_vars = np.asarray(timestep_vars, dtype = 'float64')
+            if timestep_counts is None:
+                timestep_counts = np.full(m, len(self.reps))
+            z = float(norm.ppf(1.0 - ((1.0 - (ci_level/100.0))/2.0)))
+            half_width = z * np.sqrt(self.timestep_vars / np.asarray(timestep_counts, dtype = 'float64'))
+            self.ci_lower = self.timestep_means - half_width
+            self.ci_upper = self.timestep_means + half_width
+
+        # Per-replication series, if kept
+        if rep_matrix is None:
+            self.rep_matrix = None
+        else:
+            self.rep_matrix = np.asarray(rep_matrix)
+
+        # Settings used when the figures are built
+        self.ci_level = ci_level
+        self.time_step_units = time_step_units
+        self.metric_name = metric_name
+        self.x_axis_units = x_axis_units
+        self.mark_warmup = mark_warmup
+        self.render_mode = render_mode
+        self.max_plot_points = max_plot_points
+        self.show_ci_band = show_ci_band
+        self._figures = None
+
+    def gen_figures(self) -> list:
+
+        # Build the figures on the first request only
+        if self._figures == None:
+            if isinstance(self.w,list):
+                w_lst, plot_x_2_lst, moving_avgs_lst = self.w, self.plot_x_2, self.moving_avgs
+            else:
+                w_lst, plot_x_2_lst, moving_avgs_lst = [self.w], [self.plot_x_2], [self.moving_avgs]
+
+            # x coordinate of the last warmup timestep (or of timestep 1 if no warmup is suggested)
+            if self.mark_warmup and not self.warmup_l is None:
+                warmup_x = float(self.plot_x[max(self.warmup_l - 1, 0)])
+            else:
+                warmup_x = None
+
+            # Confidence band, if requested and available
+            if self.show_ci_band and not self.ci_lower is None:
+                ci_lower, ci_upper = self.ci_lower, self.ci_upper
+            else:
+                ci_lower, ci_upper = None, None
+
+            self._figures = build_welch_figures(self.plot_x, self.timestep_means, w_lst, plot_x_2_lst,
+                                                moving_avgs_lst, len(self.reps), self.time_step_units,
+                                                self.metric_name, self.x_axis_units, warmup_x,
+                                                self.render_mode, self.max_plot_points, ci_lower, ci_upper)
+
+        return self._figures
+
+    def to_out_lst(self) -> list:
+
+        if isinstance(self.w,list):
+            moving_avgs = [i.tolist() for i in self.moving_avgs]
+            plot_x_2 = [i.tolist() for i in self.plot_x_2]
+            w = list(self.w)
+        else:
+            moving_avgs = self.moving_avgs.tolist()
+            plot_x_2 = self.plot_x_2.tolist()
+            w = self.w
+
+        # Variance and confidence band, if available
+        if self.timestep_vars is None:
+            timestep_vars, ci_lower, ci_upper = None, None, None
+        else:
+            timestep_vars = self.timestep_vars.tolist()
+            ci_lower = self.ci_lower.tolist()
+            ci_upper = self.ci_upper.tolist()
+
+        return [self.reps.tolist(), self.timesteps.tolist(), self.timestep_means.tolist(), w,
+                moving_avgs, self.plot_x.tolist(), plot_x_2, self.warmup_l, timestep_vars, ci_lower, ci_upper]
+
+    def to_plot_lst(self) -> list:
+
+        fig_0, fig_1 = self.gen_figures()
+
+        return [fig_0, fig_1, self.to_out_lst()]
+
+    @property
+    def warmup_l(self):
+
+        # Suggest a warmup length from the timestep means once, if they are all finite
+        if not self._warmup_l_done:
+            if np.isfinite(self.timestep_means).all():
+                self._warmup_l = gen_mser_warmup(self.timestep_means)
+            self._warmup_l_done = True
+
+        return self._warmup_l
+
+    def _default_warmup_l(self) -> int:
+
+        """
+        Returns the suggested warmup_l, raising if none could be suggested.
+        """
+
+        if self.warmup_l is None:
+            raise Exception('warmup_l needs to be provided when the timestep means are not all finite')
+
+        return self.warmup_l
+
+    def gen_autocorrelation(self, max_lag: int = None, warmup_l: int = None,
+                            per_replication: bool = False) -> np.ndarray:
+
+        #------------------ Confirm User Inputs -----------------------
+        # If provided, warmup_l needs to be a non-negative int leaving at least 2 timesteps
+        if warmup_l == None:
+            warmup_l = self._default_warmup_l()
+        elif not (isinstance(warmup_l,int) and 0 <= warmup_l <= len(self.timesteps) - 2):
+            raise Exception('warmup_l needs to be an int between 0 and m - 2')
+
+        # per_replication needs to be a boolean
+        if not isinstance(per_replication,bool):
+            raise Exception('per_replication needs to be a bool')
+
+        # The replication series are needed for per-replication autocorrelations
+        if per_replication and self.rep_matrix is None:
+            raise Exception('per_replication needs the replication matrix (rep_matrix) to be available')
+        #------------------ End Confirm User Inputs -------------------
+
+        # Delete the warmup period
+        if per_replication:
+            series = self.rep_matrix[:, warmup_l:]
+        else:
+            series = self.timestep_means[warmup_l:]
+
+        # Default to at most 100 lags
+        if max_lag == None:
+            max_lag = min(100, series.shape[-1] - 1)
+
+        return gen_fft_autocorrelation(series, max_lag)
+
+    def gen_correlogram(self, max_lag: int = None, warmup_l: int = None, per_replication: bool = False):
+
+        acf = self.gen_autocorrelation(max_lag, warmup_l, per_replication)
+
+        # Number of observations behind the autocorrelations
+        if warmup_l == None:
+            warmup_l = self._default_warmup_l()
+        if per_replication:
+            n_obs = self.rep_matrix.shape[0] * (self.rep_matrix.shape[1] - warmup_l)
+        else:
+            n_obs = len(self.timestep_means) - warmup_l
+
+        z = float(norm.ppf(1.0 - ((1.0 - (self.ci_level/100.0))/2.0)))
+
+        return build_correlogram_figure(acf, n_obs, self.metric_name, z)
+
+    def gen_replication_deletion_ci(self, warmup_l = None):
+
+        # The replication series are needed to compute each replication's truncated mean
+        if self.rep_matrix is None:
+            raise Exception('The replication matrix (rep_matrix) needs to be available')
+
+        if warmup_l == None:
+            warmup_l = self._default_warmup_l()
+
+        return gen_replication_deletion_ci(self.rep_matrix, warmup_l, float(self.ci_level))
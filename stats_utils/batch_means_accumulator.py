@@ -0,0 +1,207 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+import math
+from scipy.stats import t
+#---------------------------------------
+
+class BatchMeansAccumulator:
+
+    """
+    Description:
+
+    The purpose of this class is to compute the batch-means confidence interval for the steady-state mean of a
+    single long simulation run, the method of "Simulation Modeling and Analysis: 6th Edition" by Averill M. Law
+    (section 9.5.3). Instead of n replications, each with its own warmup, one long run (with its warmup already
+    deleted) is split into k batches of b consecutive observations. The batch means Y_1, ..., Y_k are treated as
+    approximately IID, so the interval is
+
+        Y_bar(k) -/+ t_{k-1, 1-alpha/2} * sqrt(S^2(k) / k)
+
+    where Y_bar(k) and S^2(k) are the sample mean and variance of the batch means.
+
+    The run is consumed in chunks of any size with add, so it never needs to fit in memory, and the batch size
+    doesn't need to be known in advance. Batches start with initial_batch_size observations. Whenever 2k batches
+    are complete, adjacent pairs are combined into k batches of twice the size, so there are always between k and
+    2k - 1 complete batches (once k are reached) and memory use is O(k). Only the batch sums and the sum of the
+    unfinished batch are kept.
+
+    The lag-1 correlation of the batch means is reported as a check of the batches being independent: a value
+    well above zero means the batches are too small for the run's autocorrelation, and more data (hence larger
+    batches) is needed.
+
+    Inputs:
+
+        num_batches (int) = (Optional) The number of batches k, at least 2. Defaults to 20
+
+        initial_batch_size (int) = (Optional) The number of observations per batch before any doubling.
+                                   Defaults to 1
+
+    Attributes:
+
+        num_batches (int) = The number of batches k
+
+        batch_size (int) = The current number of observations per batch
+
+        n (int) = The number of observations added so far
+
+    Methods:
+
+        add(values) = Adds a float, or a chunk (list, NumPy array or Pandas Series of finite int or float values,
+                      in run order), to the run.
+
+        get_batch_means() = Returns a NumPy array of the complete batch means, in run order. Observations in the
+                            unfinished batch are left out.
+
+        gen_ci(approx_confidence_level_pct) = Returns [CI lower bound, mean of the batch means, CI upper bound],
+                                              one such list per level if a list of levels is given. Needs at
+                                              least num_batches complete batches.
+
+        get_lag1_corr() = Returns the lag-1 correlation of the complete batch means. Needs at least
+                          num_batches complete batches.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_batch_means_accumulator.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    def __init__(self, num_batches: int = 20, initial_batch_size: int = 1):
+
+        # num_batches needs to be an int of at least 2
+        if not (isinstance(num_batches,int) and num_batches >= 2):
+            raise Exception('num_batches needs to be an int of at least 2')
+
+        # initial_batch_size needs to be a positive int
+        if not (isinstance(initial_batch_size,int) and initial_batch_size > 0):
+            raise Exception('initial_batch_size needs to be a positive int')
+
+        self.num_batches = num_batches
+        self.batch_size = initial_batch_size
+        self.n = 0
+
+        # Sums of the complete batches (room for 2k) and of the unfinished batch
+        self._batch_sums = np.zeros(2 * num_batches)
+        self._num_complete = 0
+        self._part_sum = 0.0
+        self._part_n = 0
+
+    def add(self, values) -> None:
+
+        # Convert to a 1-D float64 array without copying when possible
+        try:
+            wrk_values = np.asarray(values, dtype = 'float64')
+        except (TypeError, ValueError):
+            raise Exception('values needs to hold int or float values')
+
+        # values needs to be a single value or one dimensional
+        if not wrk_values.ndim <= 1:
+            raise Exception('values needs to be a single value or one dimensional')
+        wrk_values = wrk_values.reshape(-1)
+
+        # values needs to be fully populated
+        if not np.isfinite(wrk_values).all():
+            raise Exception('values needs to be fully populated with finite values')
+
+        self.n = self.n + len(wrk_values)
+
+        pos = 0
+        while pos < len(wrk_values):
+
+            # Finish the unfinished batch first
+            if self._part_n > 0:
+                num_take = min(self.batch_size - self._part_n, len(wrk_values) - pos)
+                self._part_sum = self._part_sum + float(wrk_values[pos:pos + num_take].sum())
+                self._part_n = self._part_n + num_take
+                pos = pos + num_take
+                if self._part_n == self.batch_size:
+                    self._add_batch_sums(np.array([self._part_sum]))
+                    self._part_sum = 0.0
+                    self._part_n = 0
+                continue
+
+            # Whole batches, up to the next doubling, summed with one reshape
+            num_whole = min((len(wrk_values) - pos) // self.batch_size, (2 * self.num_batches) - self._num_complete)
+            if num_whole > 0:
+                num_take = num_whole * self.batch_size
+                whole_arr = wrk_values[pos:pos + num_take].reshape(num_whole, self.batch_size)
+                self._add_batch_sums(whole_arr.sum(axis = 1))
+                pos = pos + num_take
+                continue
+
+            # Start the unfinished batch with what is left
+            self._part_sum = float(wrk_values[pos:].sum())
+            self._part_n = len(wrk_values) - pos
+            pos = len(wrk_values)
+
+    def _add_batch_sums(self, new_sums: np.ndarray) -> None:
+
+        # Store the complete batches
+        self._batch_sums[self._num_complete:self._num_complete + len(new_sums)] = new_sums
+        self._num_complete = self._num_complete + len(new_sums)
+
+        # With 2k complete batches, combine adjacent pairs into k batches of twice the size
+        if self._num_complete == 2 * self.num_batches:
+            self._batch_sums[:self.num_batches] = self._batch_sums[0::2] + self._batch_sums[1::2]
+            self._batch_sums[self.num_batches:] = 0.0
+            self._num_complete = self.num_batches
+
+            # Batches are only combined as one completes, so there is no unfinished batch to resize
+            self.batch_size = 2 * self.batch_size
+
+    def get_batch_means(self) -> np.ndarray:
+
+        return self._batch_sums[:self._num_complete] / float(self.batch_size)
+
+    def gen_ci(self, approx_confidence_level_pct) -> list:
+
+        # approx_confidence_level_pct must be a float (or a non-empty list of floats)
+        if isinstance(approx_confidence_level_pct,list):
+            if not (len(approx_confidence_level_pct) > 0 and
+                    all(isinstance(i,float) for i in approx_confidence_level_pct)):
+                raise Exception("approx_confidence_level_pct must be a float or a non-empty list of floats")
+        elif not isinstance(approx_confidence_level_pct,float):
+            raise Exception("approx_confidence_level_pct must be a float")
+
+        # At least k batches need to be complete
+        if not self._num_complete >= self.num_batches:
+            raise Exception('At least num_batches complete batches are needed')
+
+        # Mean and variance of the batch means
+        batch_means = self.get_batch_means()
+        num_means = len(batch_means)
+        grand_mean = float(batch_means.mean())
+        std_err = math.sqrt(float(batch_means.var(ddof = 1)) / float(num_means))
+
+        # Compute CI lower and upper bound for each level
+        level_lst = approx_confidence_level_pct if isinstance(approx_confidence_level_pct,list) else \
+            [approx_confidence_level_pct]
+        out_lst = []
+        for cur_level in level_lst:
+            t_val = float(t.ppf(1.0 - ((1.0 - (cur_level/100.0))/2.0), num_means - 1))
+            out_lst.append([grand_mean - (t_val * std_err), grand_mean, grand_mean + (t_val * std_err)])
+
+        if isinstance(approx_confidence_level_pct,list):
+            return out_lst
+        else:
+            return out_lst[0]
+
+    def get_lag1_corr(self) -> float:
+
+        # At least k batches need to be complete
+        if not self._num_complete >= self.num_batches:
+            raise Exception('At least num_batches complete batches are needed')
+
+        # Lag-1 correlation of the batch means (Law's estimator)
+        batch_devs = self.get_batch_means() - self.get_batch_means().mean()
+        sq_devs = float(np.dot(batch_devs, batch_devs))
+        if sq_devs == 0.0:
+            return float('nan')
+
+        return float(np.dot(batch_devs[:-1], batch_devs[1:])) / sq_devs
@@ -0,0 +1,85 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from gen_bootstrap_ci_pop_mean import _check_sample, _check_settings, _gen_boot_stats, _gen_bounds
+#-----------------------------------------------------------
+
+def gen_bootstrap_ci_diff_pop_mean(
+        x_sample,
+        y_sample,
+        approx_confidence_level,
+        num_resamples: int = 10000,
+        method: str = 'percentile',
+        seed: int = None,
+        block_size: int = None,
+        max_workers: int = 1) -> list:
+
+    """
+    Description:
+
+    This function computes a bootstrap confidence interval for the difference of two population means,
+    mu_x - mu_y, from two independent samples (Efron and Tibshirani, "An Introduction to the Bootstrap", chapters
+    13 and 14). It is the bootstrap counterpart of gen_large_sample_ci_diff_pop_mean for skewed or heavy-tailed
+    metrics and small samples.
+
+    Each bootstrap resample draws x_sample and y_sample separately with replacement, and its statistic is the
+    mean of the x resample minus the mean of the y resample. Resamples are drawn in blocks of index matrices, one
+    random stream per block, and optionally split across worker processes, exactly as in
+    gen_bootstrap_ci_pop_mean. For method = 'bca', the acceleration comes from the empirical influence values of
+    both samples.
+
+    Inputs:
+
+        x_sample (list) = A list of floats, each an IID draw from population x. A one dimensional NumPy array or
+                          Pandas Series of finite floats can be given instead. Needs at least 2 values.
+
+        y_sample (list) = A list of floats, each an IID draw from population y. A one dimensional NumPy array or
+                          Pandas Series of finite floats can be given instead. Needs at least 2 values.
+
+        approx_confidence_level (float) = The approximate confidence level desired for the confidence interval
+                                          expressed as a percentage. For example, if you want a 95% confidence
+                                          interval, provide 95.0. A list of levels can be given to get an
+                                          interval for each level from the same resamples.
+
+        num_resamples, method, seed, block_size, max_workers = As in gen_bootstrap_ci_pop_mean.
+
+    Outputs:
+
+        out_lst (list) = A list where index 0 is the CI lower bound, index 1 is the sample mean of x minus the
+                         sample mean of y, and index 2 is the CI upper bound. If approx_confidence_level is a
+                         list, a list holding one such list per level, in the same order.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_bootstrap_ci_diff_pop_mean.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Check User Inputs ---------------------
+    # x_sample and y_sample need to be lists, NumPy arrays or Pandas Series of finite floats
+    x_arr = _check_sample(x_sample, 'x_sample')
+    y_arr = _check_sample(y_sample, 'y_sample')
+
+    # approx_confidence_level and the bootstrap settings
+    _check_settings(approx_confidence_level, 'approx_confidence_level', num_resamples, method, seed, block_size,
+                    max_workers)
+    #----------------------------------------------------------
+
+    # Differences of the resample means
+    boot_stats = _gen_boot_stats([x_arr, y_arr], num_resamples, seed, block_size, max_workers)
+
+    # Influence of each value on the difference of means (only used by BCa)
+    x_mean = float(x_arr.mean())
+    y_mean = float(y_arr.mean())
+    influence = np.concatenate(((x_arr - x_mean) / len(x_arr), -(y_arr - y_mean) / len(y_arr)))
+
+    return _gen_bounds(boot_stats, x_mean - y_mean, influence, approx_confidence_level, method)
@@ -0,0 +1,252 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import pandas as pd
+import numpy as np
+from scipy.stats import norm
+from concurrent.futures import ProcessPoolExecutor
+#---------------------------------------
+
+def gen_bootstrap_ci_pop_mean(
+        sample,
+        approx_confidence_level_pct,
+        num_resamples: int = 10000,
+        method: str = 'percentile',
+        seed: int = None,
+        block_size: int = None,
+        max_workers: int = 1) -> list:
+
+    """
+    Description:
+
+    This function computes a bootstrap confidence interval for the population mean, following "An Introduction
+    to the Bootstrap" by Bradley Efron and Robert J. Tibshirani (percentile interval, chapter 13; BCa interval,
+    chapter 14). Unlike gen_large_sample_ci_pop_mean it does not rely on the sample mean being close to normal,
+    so it is better suited to skewed or heavy-tailed metrics such as latencies.
+
+    The sample is resampled with replacement num_resamples times. The resamples are drawn in blocks: each block
+    is a block_size x n NumPy matrix of random indices into the sample, and the block's resample means come from
+    one fancy-indexing and row-mean operation, so the memory used is bounded by one block rather than by
+    num_resamples x n. Every block has its own random stream spawned from seed (numpy.random.SeedSequence), so
+    the result depends only on seed and block_size, not on max_workers. With max_workers > 1 the blocks are split
+    across worker processes.
+
+    With method = 'percentile', the bounds are the alpha/2 and 1 - alpha/2 quantiles of the resample means.
+    With method = 'bca', the quantiles are adjusted for the bias of the resample means (the proportion below the
+    sample mean) and for skewness (the acceleration, from the jackknife values of the mean).
+
+    Inputs:
+
+        sample (list) = A list of floats where each value is an IID draw from the population. A one dimensional
+                        NumPy array or Pandas Series of finite floats can be given instead. Needs at least 2
+                        values.
+
+        approx_confidence_level_pct (float) = The approximate confidence level desired for the confidence interval
+                                              expressed as a percentage. For example, if you want a 95% confidence
+                                              interval, provide 95.0. A list of levels can be given to get an
+                                              interval for each level from the same resamples.
+
+        num_resamples (int) = (Optional) Number of bootstrap resamples. Defaults to 10000
+
+        method (string) = (Optional) 'percentile' or 'bca'. Defaults to 'percentile'
+
+        seed (int) = (Optional) Seed of the random streams. Defaults to None (not reproducible)
+
+        block_size (int) = (Optional) Number of resamples per block. Defaults to None, which picks the largest
+                           block with at most 4194304 indices (32 MB of int64)
+
+        max_workers (int) = (Optional) Number of worker processes. With 1 (the default) all blocks are drawn in
+                            the calling process.
+
+    Outputs:
+
+        out_lst (list) = A list where index 0 is the CI lower bound, index 1 is the sample mean, and index 2 is
+                         the CI upper bound. If approx_confidence_level_pct is a list, a list holding one such
+                         list per level, in the same order.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_bootstrap_ci_pop_mean.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Check User Inputs ---------------------
+    # sample needs to be a list, NumPy array or Pandas Series of finite floats
+    sample_arr = _check_sample(sample, 'sample')
+
+    # approx_confidence_level_pct and the bootstrap settings
+    _check_settings(approx_confidence_level_pct, 'approx_confidence_level_pct', num_resamples, method, seed,
+                    block_size, max_workers)
+    #----------------------------------------------------------
+
+    # Means of the resamples
+    boot_stats = _gen_boot_stats([sample_arr], num_resamples, seed, block_size, max_workers)
+
+    # Influence of each value on the mean (only used by BCa)
+    sample_mean = float(sample_arr.mean())
+    influence = (sample_arr - sample_mean) / len(sample_arr)
+
+    return _gen_bounds(boot_stats, sample_mean, influence, approx_confidence_level_pct, method)
+
+
+def _check_sample(sample, sample_name: str) -> np.ndarray:
+
+    """
+    Returns sample as a one dimensional float64 NumPy array, raising the user input errors of the bootstrap
+    functions otherwise.
+    """
+
+    if isinstance(sample,list):
+        if not all(isinstance(i,float) for i in sample):
+            raise Exception("{} must contain all floats".format(sample_name))
+        sample_arr = np.array(sample, dtype = 'float64')
+    elif isinstance(sample,(np.ndarray, pd.Series)):
+        sample_arr = np.asarray(sample)
+        if not (sample_arr.ndim == 1 and np.issubdtype(sample_arr.dtype, np.floating)):
+            raise Exception("{} must contain all floats".format(sample_name))
+        sample_arr = sample_arr.astype('float64', copy = False)
+    else:
+        raise Exception("{} needs to be a list, NumPy array or Pandas Series".format(sample_name))
+
+    if not np.isfinite(sample_arr).all():
+        raise Exception("{} must contain all finite floats".format(sample_name))
+
+    if not len(sample_arr) >= 2:
+        raise Exception("The sample size of {} must be at least 2".format(sample_name))
+
+    return sample_arr
+
+
+def _check_settings(approx_confidence_level, level_name: str, num_resamples: int, method: str, seed: int,
+                    block_size: int, max_workers: int) -> None:
+
+    """
+    Raises the user input errors of the bootstrap functions for the confidence level(s) and the bootstrap
+    settings.
+    """
+
+    # The confidence level needs to be a float (or a non-empty list of floats) between 0 and 100
+    level_lst = approx_confidence_level if isinstance(approx_confidence_level,list) else [approx_confidence_level]
+    if not (len(level_lst) > 0 and all(isinstance(i,float) and 0.0 < i < 100.0 for i in level_lst)):
+        raise Exception("{} needs to be a float or a non-empty list of floats between 0.0 and 100.0".format(
+            level_name))
+
+    # num_resamples needs to be an int of at least 2
+    if not (isinstance(num_resamples,int) and num_resamples >= 2):
+        raise Exception('num_resamples needs to be an int of at least 2')
+
+    # method needs to be 'percentile' or 'bca'
+    if not method in ['percentile', 'bca']:
+        raise Exception("method needs to be 'percentile' or 'bca'")
+
+    # seed needs to be a non-negative int if provided
+    if not (seed is None or (isinstance(seed,int) and seed >= 0)):
+        raise Exception('seed needs to be a non-negative int if provided')
+
+    # block_size and max_workers need to be positive ints
+    if not (block_size is None or (isinstance(block_size,int) and block_size > 0)):
+        raise Exception('block_size needs to be a positive int if provided')
+    if not (isinstance(max_workers,int) and max_workers > 0):
+        raise Exception('max_workers needs to be a positive int')
+
+
+def _gen_boot_stats(sample_arrs: list, num_resamples: int, seed: int, block_size: int,
+                    max_workers: int) -> np.ndarray:
+
+    """
+    Returns the num_resamples bootstrap statistics of sample_arrs (the mean for one sample, the difference of
+    means for two), drawn in blocks of block_size resamples, each block with its own random stream spawned from
+    seed, and split across max_workers worker processes.
+    """
+
+    # Largest block with at most 4194304 indices per sample by default
+    if block_size is None:
+        block_size = max(1, 4194304 // max(len(i) for i in sample_arrs))
+    block_size = min(block_size, num_resamples)
+
+    # One random stream per block, so the result doesn't depend on the number of workers
+    num_blocks = -(-num_resamples // block_size)
+    block_sizes = [block_size] * (num_blocks - 1) + [num_resamples - (block_size * (num_blocks - 1))]
+    block_seeds = np.random.SeedSequence(seed).spawn(num_blocks)
+
+    max_workers = min(max_workers, num_blocks)
+    if max_workers == 1:
+        return _draw_blocks(sample_arrs, block_sizes, block_seeds)
+
+    # Contiguous ranges of blocks, one per worker, concatenated in block order
+    bounds = np.linspace(0, num_blocks, max_workers + 1).round().astype(int)
+    with ProcessPoolExecutor(max_workers = max_workers) as executor:
+        part_lst = list(executor.map(_draw_blocks, [sample_arrs] * max_workers,
+                                     [block_sizes[bounds[i]:bounds[i + 1]] for i in range(max_workers)],
+                                     [block_seeds[bounds[i]:bounds[i + 1]] for i in range(max_workers)]))
+
+    return np.concatenate(part_lst)
+
+
+def _draw_blocks(sample_arrs: list, block_sizes: list, block_seeds: list) -> np.ndarray:
+
+    """
+    Returns the bootstrap statistics of the given blocks. Each block draws a block size x n index matrix per
+    sample from its own random stream.
+    """
+
+    out_lst = []
+    for cur_size, cur_seed in zip(block_sizes, block_seeds):
+        rng = np.random.default_rng(cur_seed)
+        cur_stats = None
+        for i, cur_arr in enumerate(sample_arrs):
+            idx = rng.integers(0, len(cur_arr), size = (cur_size, len(cur_arr)))
+            cur_means = cur_arr[idx].mean(axis = 1)
+            cur_stats = cur_means if i == 0 else cur_stats - cur_means
+        out_lst.append(cur_stats)
+
+    return np.concatenate(out_lst)
+
+
+def _gen_bounds(boot_stats: np.ndarray, estimate: float, influence: np.ndarray, approx_confidence_level,
+                method: str) -> list:
+
+    """
+    Returns [CI lower bound, estimate, CI upper bound] from the bootstrap statistics for each level, using the
+    percentile or the BCa quantiles. influence holds the empirical influence values of the estimate, from which
+    the BCa acceleration is computed.
+    """
+
+    level_lst = approx_confidence_level if isinstance(approx_confidence_level,list) else [approx_confidence_level]
+    alpha_arr = 1.0 - (np.array(level_lst) / 100.0)
+
+    if method == 'percentile':
+        lower_q = alpha_arr / 2.0
+        upper_q = 1.0 - (alpha_arr / 2.0)
+
+    else:
+        # BCa needs some spread in the sample
+        if not np.dot(influence, influence) > 0.0:
+            raise Exception("method 'bca' needs a sample with at least 2 different values")
+
+        # Bias correction from the proportion of resamples below the estimate (ties count half)
+        num_boot = len(boot_stats)
+        prop_below = (np.sum(boot_stats < estimate) + (0.5 * np.sum(boot_stats == estimate))) / num_boot
+        z_0 = norm.ppf(min(max(prop_below, 0.5 / num_boot), 1.0 - (0.5 / num_boot)))
+
+        # Acceleration from the influence values
+        accel = np.sum(influence ** 3) / (6.0 * (np.sum(influence ** 2) ** 1.5))
+
+        z_lower = z_0 + norm.ppf(alpha_arr / 2.0)
+        z_upper = z_0 + norm.ppf(1.0 - (alpha_arr / 2.0))
+        lower_q = norm.cdf(z_0 + (z_lower / (1.0 - (accel * z_lower))))
+        upper_q = norm.cdf(z_0 + (z_upper / (1.0 - (accel * z_upper))))
+
+    lower_arr = np.quantile(boot_stats, lower_q)
+    upper_arr = np.quantile(boot_stats, upper_q)
+    out_lst = [[float(lower_arr[i]), estimate, float(upper_arr[i])] for i in range(len(level_lst))]
+
+    if isinstance(approx_confidence_level,list):
+        return out_lst
+    else:
+        return out_lst[0]
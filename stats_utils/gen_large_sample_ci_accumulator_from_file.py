@@ -0,0 +1,152 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from large_sample_ci_accumulator import LargeSampleCIAccumulator
+#-----------------------------------------------------------
+
+def gen_large_sample_ci_accumulator_from_file(
+        file_path: str,
+        dtype: str = 'float64',
+        offset: int = 0,
+        chunk_size: int = 4194304,
+        max_workers: int = 1) -> LargeSampleCIAccumulator:
+
+    """
+    Description:
+
+    This function gets the sufficient statistics for the large-sample confidence intervals of
+    gen_large_sample_ci_pop_mean (Devore p.286) and gen_large_sample_ci_diff_pop_mean (Devore p.369) from a
+    sample stored in a binary file that may be far larger than memory, e.g., a raw float64 dump or a .npy file
+    written by a simulator. The file is opened with numpy.memmap, so nothing is read up front, and it is
+    scanned in chunks of chunk_size values that are added to a LargeSampleCIAccumulator. Only one chunk (and
+    its float64 deviations) is held in memory at a time, so the memory used is bounded by chunk_size rather
+    than by the file size.
+
+    With max_workers > 1 the chunks are split into max_workers contiguous ranges and each range is scanned by
+    a worker process with its own memmap of the file. The workers' accumulators are merged (Chan et al.), which
+    gives the same sample size, mean and variance as a single scan up to floating point rounding.
+
+    The returned accumulator's gen_ci method gives the interval of gen_large_sample_ci_pop_mean, and the
+    gen_diff_ci method of the x_sample's accumulator, given the y_sample's accumulator, gives the interval of
+    gen_large_sample_ci_diff_pop_mean.
+
+    Inputs:
+
+        file_path (string) = Path to the sample file. A .npy file is read with the dtype and shape in its
+                             header (every value of the array is part of the sample). Any other file is read as
+                             raw values of dtype.
+
+        dtype (string) = (Optional) The int or float dtype of the values in a raw file, e.g., 'float64' or
+                         'float32'. Ignored for .npy files. Defaults to 'float64'
+
+        offset (int) = (Optional) Number of header bytes before the first value in a raw file. Ignored for .npy
+                       files. Defaults to 0
+
+        chunk_size (int) = (Optional) Number of values read per chunk. Defaults to 4194304 (32 MB of float64)
+
+        max_workers (int) = (Optional) Number of worker processes. With 1 (the default) the file is scanned in
+                            the calling process.
+
+    Outputs:
+
+        out_acc (LargeSampleCIAccumulator) = The accumulator holding the sample size, mean and squared
+                                             deviations of the sample.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_large_sample_ci_accumulator_from_file.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Check User Inputs ---------------------
+    # file_path needs to be an existing file
+    if not (isinstance(file_path,str) and os.path.isfile(file_path)):
+        raise Exception('file_path needs to be the path of an existing file')
+
+    # chunk_size and max_workers need to be positive ints
+    if not (isinstance(chunk_size,int) and chunk_size > 0):
+        raise Exception('chunk_size needs to be a positive int')
+    if not (isinstance(max_workers,int) and max_workers > 0):
+        raise Exception('max_workers needs to be a positive int')
+
+    # The value dtype and the byte offset of the first value come from the .npy header or the inputs
+    if file_path.endswith('.npy'):
+        with open(file_path, 'rb') as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, val_dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, val_dtype = np.lib.format.read_array_header_2_0(f)
+            offset = f.tell()
+        num_values = int(np.prod(shape))
+
+        # The .npy file needs to hold ints or floats
+        if not (np.issubdtype(val_dtype, np.integer) or np.issubdtype(val_dtype, np.floating)):
+            raise Exception('The .npy file needs to hold int or float values')
+    else:
+        try:
+            val_dtype = np.dtype(dtype)
+        except TypeError:
+            raise Exception('dtype needs to be an int or float dtype')
+        if not (np.issubdtype(val_dtype, np.integer) or np.issubdtype(val_dtype, np.floating)):
+            raise Exception('dtype needs to be an int or float dtype')
+        if not (isinstance(offset,int) and 0 <= offset <= os.path.getsize(file_path)):
+            raise Exception('offset needs to be an int between 0 and the file size')
+
+        # The bytes after the offset need to be whole values
+        num_bytes = os.path.getsize(file_path) - offset
+        if not num_bytes % val_dtype.itemsize == 0:
+            raise Exception('The file size after offset needs to be a multiple of the dtype size')
+        num_values = num_bytes // val_dtype.itemsize
+    #----------------------------------------------------------
+
+    # Nothing to scan for an empty file
+    if num_values == 0:
+        return LargeSampleCIAccumulator()
+
+    # Scan in the calling process, or split the chunks into contiguous ranges, one per worker
+    num_chunks = -(-num_values // chunk_size)
+    max_workers = min(max_workers, num_chunks)
+    if max_workers == 1:
+        return _scan_values(file_path, val_dtype, offset, num_values, 0, num_values, chunk_size)
+
+    chunk_bounds = np.linspace(0, num_chunks, max_workers + 1).round().astype(int)
+    starts = [min(int(i) * chunk_size, num_values) for i in chunk_bounds[:-1]]
+    stops = [min(int(i) * chunk_size, num_values) for i in chunk_bounds[1:]]
+
+    out_acc = LargeSampleCIAccumulator()
+    with ProcessPoolExecutor(max_workers = max_workers) as executor:
+        for part_acc in executor.map(_scan_values, [file_path] * max_workers, [val_dtype] * max_workers,
+                                     [offset] * max_workers, [num_values] * max_workers, starts, stops,
+                                     [chunk_size] * max_workers):
+            out_acc.merge(part_acc)
+
+    return out_acc
+
+
+def _scan_values(file_path: str, val_dtype, offset: int, num_values: int, start: int, stop: int,
+                 chunk_size: int) -> LargeSampleCIAccumulator:
+
+    """
+    Memory maps the num_values values of file_path and returns a LargeSampleCIAccumulator of the values from
+    start up to stop, added chunk_size values at a time.
+    """
+
+    values = np.memmap(file_path, dtype = val_dtype, mode = 'r', offset = offset, shape = (num_values,))
+
+    out_acc = LargeSampleCIAccumulator()
+    for chunk_start in range(start, stop, chunk_size):
+        out_acc.add(values[chunk_start:min(chunk_start + chunk_size, stop)])
+
+    return out_acc
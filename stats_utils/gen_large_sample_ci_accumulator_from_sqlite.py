@@ -0,0 +1,161 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import sqlite3
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from quote_sqlite_ident import quote_sqlite_ident
+from large_sample_ci_accumulator import LargeSampleCIAccumulator
+#-----------------------------------------------------------
+
+def gen_large_sample_ci_accumulator_from_sqlite(
+        conn: sqlite3.Connection,
+        table: str,
+        value_col: str,
+        where: str = None,
+        params = (),
+        group_by = None):
+
+    """
+    Description:
+
+    This function gets the sufficient statistics for the large-sample confidence intervals of
+    gen_large_sample_ci_pop_mean (Devore p.286) and gen_large_sample_ci_diff_pop_mean (Devore p.369) for a
+    column of a SQLite table without pulling the sample into Python. The count, mean and squared deviations of the
+    column are computed inside SQLite in one query (optionally filtered by a WHERE clause and split by GROUP BY
+    columns), so only a few numbers per group cross into Python. They are loaded into a
+    LargeSampleCIAccumulator (see add_stats), whose gen_ci and gen_diff_ci methods then return the intervals.
+
+    Samples already reduced to (n, sum, sum of squares) or (n, mean, variance) elsewhere can be loaded with the
+    add_sums and add_stats methods of LargeSampleCIAccumulator directly.
+
+    Inputs:
+
+        conn (sqlite3.Connection) = An open connection to the SQLite database.
+
+        table (string) = Name of the table holding the sample.
+
+        value_col (string) = Name of the integer or real column within table holding the sample values. NULL
+                             values are left out of the sample.
+
+        where (string) = (Optional) A SQL condition limiting the rows used, e.g., "scenario = ?", added as the
+                         WHERE clause of the queries. Defaults to None (all rows)
+
+        params (tuple, list or dictionary) = (Optional) Values bound to the placeholders within where. Defaults
+                                             to ()
+
+        group_by (string or list) = (Optional) Name, or list of names, of the columns within table splitting the
+                                    rows into groups, each with its own sample. Defaults to None (one sample)
+
+    Outputs:
+
+        If group_by is None:
+
+            out_acc (LargeSampleCIAccumulator) = The accumulator holding the sample size, mean and squared
+                                                 deviations of the sample.
+
+        If group_by is given:
+
+            out_dict (dictionary) = Maps each group to its LargeSampleCIAccumulator, sorted by the group columns.
+                                    The keys are the group values if group_by is a string and tuples of group
+                                    values if group_by is a list.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_large_sample_ci_accumulator_from_sqlite.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Check User Inputs ---------------------
+    # conn needs to be a SQLite connection
+    if not isinstance(conn, sqlite3.Connection):
+        raise Exception('conn needs to be a sqlite3 Connection')
+
+    # table needs to be a table within the database
+    if not isinstance(table,str):
+        raise Exception('table needs to be a string')
+    table_cols = [i[1] for i in conn.execute('PRAGMA table_info({})'.format(quote_sqlite_ident(table))).fetchall()]
+    if len(table_cols) == 0:
+        raise Exception('table needs to be the name of a table within the database')
+
+    # value_col needs to be a column within table
+    if not isinstance(value_col,str):
+        raise Exception('value_col needs to be a string')
+    if not value_col in table_cols:
+        raise Exception('value_col needs to be the name of a column within table')
+
+    # where needs to be a string if provided
+    if not (where is None or isinstance(where,str)):
+        raise Exception('where needs to be a string if provided')
+
+    # params needs to be a tuple, list or dictionary
+    if not isinstance(params,(tuple, list, dict)):
+        raise Exception('params needs to be a tuple, list or dictionary')
+
+    # group_by needs to name columns within table if provided
+    if group_by is None:
+        group_lst = []
+    else:
+        group_lst = [group_by] if isinstance(group_by,str) else group_by
+        if not (isinstance(group_lst,list) and len(group_lst) > 0 and all(isinstance(i,str) for i in group_lst)):
+            raise Exception('group_by needs to be a string or a non-empty list of strings if provided')
+        for i in group_lst:
+            if not i in table_cols:
+                raise Exception('group_by needs to name columns within table')
+    #----------------------------------------------------------
+
+    t_sql = quote_sqlite_ident(table)
+    val_sql = quote_sqlite_ident(value_col)
+    where_sql = '' if where is None else 'AND ({})'.format(where)
+    g_alias = ['g{}'.format(i) for i in range(len(group_lst))]
+
+    # One grouped query: count of non-numeric values, count, mean and squared deviations from each group's mean
+    src_sel = ''.join('{} AS {}, '.format(quote_sqlite_ident(i), j) for i, j in zip(group_lst, g_alias))
+    if len(group_lst) > 0:
+        g_sel = ', '.join('grp.{}'.format(i) for i in g_alias) + ','
+        g_by = 'GROUP BY ' + ', '.join(g_alias)
+        join_on = ' AND '.join('src.{0} IS grp.{0}'.format(i) for i in g_alias)
+        out_by = 'GROUP BY {0} ORDER BY {0}'.format(', '.join('grp.{}'.format(i) for i in g_alias))
+    else:
+        g_sel, g_by, join_on, out_by = '', '', '1 = 1', ''
+    stat_rows = conn.execute("""
+        WITH src AS (SELECT {src_sel}{v} AS v FROM {t} WHERE {v} IS NOT NULL {w}),
+             grp AS (SELECT {g_cols}SUM(typeof(v) NOT IN ('integer', 'real')) AS bad, COUNT(v) AS cnt,
+                            AVG(v) AS mu
+                     FROM src {g_by})
+        SELECT {g_sel} grp.bad, grp.cnt, grp.mu, SUM((src.v - grp.mu) * (src.v - grp.mu))
+        FROM grp LEFT JOIN src ON {join_on}
+        {out_by}
+        """.format(src_sel = src_sel, v = val_sql, t = t_sql, w = where_sql,
+                   g_cols = ''.join('{}, '.format(i) for i in g_alias), g_by = g_by, g_sel = g_sel,
+                   join_on = join_on, out_by = out_by), params).fetchall()
+
+    # Load each group's statistics into an accumulator
+    num_g = len(group_lst)
+    out_dict = {}
+    for cur_row in stat_rows:
+
+        # value_col needs to hold numbers
+        if cur_row[num_g] is not None and cur_row[num_g] > 0:
+            raise Exception('value_col needs to hold only integer, real or NULL values')
+
+        cur_acc = LargeSampleCIAccumulator()
+        cur_n = int(cur_row[num_g + 1])
+        if cur_n > 0:
+            cur_acc.add_stats(cur_n, float(cur_row[num_g + 2]),
+                              float(cur_row[num_g + 3]) / float(cur_n - 1) if cur_n > 1 else 0.0)
+
+        if num_g == 0:
+            return cur_acc
+        elif isinstance(group_by,str):
+            out_dict[cur_row[0]] = cur_acc
+        else:
+            out_dict[tuple(cur_row[:num_g])] = cur_acc
+
+    return out_dict
@@ -0,0 +1,143 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import pandas as pd
+from pandas import DataFrame as df
+import numpy as np
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from gen_z_value import gen_z_value
+#-----------------------------------------------------------
+
+def gen_large_sample_ci_by_group(
+        in_df: df,
+        group_cols,
+        value_cols,
+        approx_confidence_level_pct: float) -> df:
+
+    """
+    Description:
+
+    This function computes the large-sample confidence interval for a population mean of
+    gen_large_sample_ci_pop_mean (Devore p.286) for every group of a long DataFrame at once, e.g., for every
+    scenario and every metric of a simulation experiment. Rather than slicing the DataFrame and converting each
+    group to a list, the sample size, mean and variance of every value column in every group come from one
+    vectorized groupby aggregation, and every interval is then computed with array operations.
+
+    Groups with a sample size of 40 or less do not meet the large-sample requirement (Devore p.286). Instead of
+    raising, as gen_large_sample_ci_pop_mean does, these groups are flagged in the small_sample column and their
+    bounds are left as NaN, so one small group does not stop the rest of the batch.
+
+    Inputs:
+
+        in_df (Pandas DataFrame) = The DataFrame holding the groups and values.
+
+        group_cols (string or list) = Name, or list of names, of the columns within in_df identifying the groups.
+
+        value_cols (string or list) = Name, or list of names, of the int or float columns within in_df holding the
+                                      sample values. Each value column is handled separately. Missing values are
+                                      left out of the sample.
+
+        approx_confidence_level_pct (float) = The approximate confidence level desired for the confidence intervals
+                                              expressed as a percentage. For example, if you want 95% confidence
+                                              intervals, provide 95.0. A list of levels can be given to get the
+                                              intervals for each level from the same groupby aggregation.
+
+    Outputs:
+
+        out_df (Pandas DataFrame) = A tidy DataFrame with one row per group and value column, sorted by the group
+                                    columns and then in the order of value_cols. The columns are the group_cols,
+                                    'value_col' (the value column name), 'n' (sample size), 'mean', 'var' (sample
+                                    variance), 'ci_lower', 'ci_upper' and 'small_sample' (True when n <= 40, in
+                                    which case ci_lower and ci_upper are NaN). If approx_confidence_level_pct
+                                    is a list, a list holding one such DataFrame per level, in the same order.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_large_sample_ci_by_group.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Check User Inputs ---------------------
+    # in_df needs to be a DataFrame
+    if not isinstance(in_df, df):
+        raise Exception("in_df needs to be a Pandas DataFrame")
+
+    # group_cols and value_cols need to be column names (or non-empty lists of column names)
+    col_lsts = []
+    for col_name, cols in [('group_cols', group_cols), ('value_cols', value_cols)]:
+        if isinstance(cols,str):
+            cols = [cols]
+        if not (isinstance(cols,list) and len(cols) > 0 and all(isinstance(i,str) for i in cols)):
+            raise Exception("{} needs to be a string or a non-empty list of strings".format(col_name))
+        for i in cols:
+            if not i in in_df.columns:
+                raise Exception("{} needs to name columns within in_df".format(col_name))
+        col_lsts.append(cols)
+    group_lst, value_lst = col_lsts
+
+    # The value columns need to be int or float
+    for i in value_lst:
+        if not (pd.api.types.is_integer_dtype(in_df[i].dtype) or pd.api.types.is_float_dtype(in_df[i].dtype)):
+            raise Exception("The value_cols columns within in_df need to be int or float")
+
+    # A column can't be both a group column and a value column
+    if len(set(group_lst) & set(value_lst)) > 0:
+        raise Exception("group_cols and value_cols need to be different columns")
+
+    # approx_confidence_level_pct must be a float (or a non-empty list of floats)
+    if isinstance(approx_confidence_level_pct,list):
+        if not (len(approx_confidence_level_pct) > 0 and all(isinstance(i,float) for i in approx_confidence_level_pct)):
+            raise Exception("approx_confidence_level_pct must be a float or a non-empty list of floats")
+    elif not isinstance(approx_confidence_level_pct,float):
+        raise Exception("approx_confidence_level_pct must be a float")
+    #----------------------------------------------------------
+
+    # Sample size, mean and variance for every group and value column in one pass
+    stats_df = in_df.groupby(group_lst, sort = True, dropna = False)[value_lst].agg(['count', 'mean', 'var'])
+
+    # One block of rows per value column, in the order of value_cols
+    out_lst = []
+    for cur_col in value_lst:
+        cur_df = stats_df[cur_col].reset_index()
+        cur_df.insert(len(group_lst), 'value_col', cur_col)
+        cur_df = cur_df.rename(columns = {'count' : 'n'})
+
+        # Flag groups too small for the large-sample interval
+        cur_df['small_sample'] = ~(cur_df['n'] > 40)
+        out_lst.append(cur_df)
+
+    # Sort by the group columns, keeping the value_cols order within each group
+    base_df = pd.concat(out_lst, ignore_index = True)
+    base_df['value_col'] = pd.Categorical(base_df['value_col'], categories = value_lst)
+    base_df = base_df.sort_values(group_lst + ['value_col'], kind = 'stable').reset_index(drop = True)
+    base_df['value_col'] = base_df['value_col'].astype(str)
+    std_err = np.sqrt(base_df['var'] / base_df['n'])
+
+    # One DataFrame of intervals per level from the same statistics
+    if isinstance(approx_confidence_level_pct,list):
+        level_lst = approx_confidence_level_pct
+    else:
+        level_lst = [approx_confidence_level_pct]
+
+    out_lst = []
+    for cur_level in level_lst:
+
+        # Get z value
+        z = gen_z_value(cur_level)
+
+        out_df = base_df.copy()
+        out_df['ci_lower'] = (out_df['mean'] - (z * std_err)).where(~out_df['small_sample'])
+        out_df['ci_upper'] = (out_df['mean'] + (z * std_err)).where(~out_df['small_sample'])
+        out_lst.append(out_df[group_lst + ['value_col', 'n', 'mean', 'var', 'ci_lower', 'ci_upper', 'small_sample']])
+
+    if isinstance(approx_confidence_level_pct,list):
+        return out_lst
+    else:
+        return out_lst[0]
@@ -6,13 +6,16 @@
 import pandas as pd
 import copy
 import math
-from scipy.stats import norm
 #---------------------------------------
 
+#--------------- Import user defined functions -------------
+from gen_z_value import gen_z_value
+#-----------------------------------------------------------
+
 def gen_large_sample_ci_diff_pop_mean(
         x_sample: list,
         y_sample: list,
-        approx_confidence_level: float):
+        approx_confidence_level):
     
     """
     Description:
@@ -45,12 +48,15 @@ def gen_large_sample_ci_diff_pop_mean(
 
         approx_confidence_level (float) = The approximate confidence level desired for the confidence interval
                                           expressed as a percentage. For example, if you want a 95% confidence 
-                                          interval, provide 95.0.
+                                          interval, provide 95.0. A list of levels (e.g., [90.0, 95.0, 99.0])
+                                          can be given to get an interval for each level from one pass over the
+                                          samples.
         
     Outputs:
 
         out_lst (list)  =  A list of floats where index 0 is the CI lower bound, index 1 is the x_sample mean minus 
-                           the y-sample mean, and index 2 is the CI upper bound.
+                           the y-sample mean, and index 2 is the CI upper bound. If approx_confidence_level is a list,
+                           a list holding one such list per level, in the same order.
 
     Testing:
 
@@ -89,8 +95,11 @@ def gen_large_sample_ci_diff_pop_mean(
     if not len(y_sample) > 40:
         raise Exception("The sample size for y_sample needs to be > 40")
     
-    # approx_confidence_level needs to be a float
-    if not isinstance(approx_confidence_level,float):
+    # approx_confidence_level needs to be a float (or a non-empty list of floats)
+    if isinstance(approx_confidence_level,list):
+        if not (len(approx_confidence_level) > 0 and all(isinstance(i,float) for i in approx_confidence_level)):
+            raise Exception("approx_confidence_level needs to be a float or a non-empty list of floats")
+    elif not isinstance(approx_confidence_level,float):
         raise Exception("approx_confidence_level needs to be a float")
     #------------------ End Check for Input Errors -------------------------
 
@@ -98,9 +107,6 @@ def gen_large_sample_ci_diff_pop_mean(
     wrk_x_sample = copy.deepcopy(x_sample)
     wrk_y_sample = copy.deepcopy(y_sample)
 
-    # Compute Alpha
-    alpha = 1.0 - (approx_confidence_level/100.0)
-
     # Compute sample sizes
     m = float(len(wrk_x_sample))
     n = float(len(wrk_y_sample))
@@ -121,17 +127,31 @@ def gen_large_sample_ci_diff_pop_mean(
         run_sum = run_sum + float(((i - y_mean) ** 2))
     s_2_squared = float(run_sum/(n - 1.0))
 
-    # Get z value
-    z = float(norm.ppf(1.0 - (alpha/2.0)))
-
     # Get x_sample mean minus y_sample mean
     x_s_mean_minus_y_s_mean = float(x_mean - y_mean)
 
-    # Compute CI lower bound
-    ci_lower = float(x_s_mean_minus_y_s_mean - (z * float(math.sqrt((s_1_squared/m) + (s_2_squared/n)))))
+    # One interval per level from the same sample statistics
+    if isinstance(approx_confidence_level,list):
+        level_lst = approx_confidence_level
+    else:
+        level_lst = [approx_confidence_level]
+
+    out_lst = []
+    for cur_level in level_lst:
+
+        # Get z value (from the cache after the first call for a level)
+        z = gen_z_value(cur_level)
+
+        # Compute CI lower bound
+        ci_lower = float(x_s_mean_minus_y_s_mean - (z * float(math.sqrt((s_1_squared/m) + (s_2_squared/n)))))
+
+        # Compute CI upper bound
+        ci_upper = float(x_s_mean_minus_y_s_mean + (z * float(math.sqrt((s_1_squared/m) + (s_2_squared/n)))))
 
-    # Compute CI upper bound
-    ci_upper = float(x_s_mean_minus_y_s_mean + (z * float(math.sqrt((s_1_squared/m) + (s_2_squared/n)))))
+        out_lst.append([ci_lower, x_s_mean_minus_y_s_mean, ci_upper])
 
     # Return out_lst
-    return [ci_lower, x_s_mean_minus_y_s_mean, ci_upper]
+    if isinstance(approx_confidence_level,list):
+        return out_lst
+    else:
+        return out_lst[0]
@@ -0,0 +1,154 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import pandas as pd
+from pandas import DataFrame as df
+import numpy as np
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from large_sample_ci_accumulator import LargeSampleCIAccumulator
+from gen_z_value import gen_z_value
+#-----------------------------------------------------------
+
+def gen_large_sample_ci_diff_pop_mean_pairwise(
+        samples: dict,
+        approx_confidence_level: float,
+        adjustment: str = None) -> list:
+
+    """
+    Description:
+
+    This function computes the large-sample confidence interval for the difference in population means of
+    gen_large_sample_ci_diff_pop_mean (Devore p.369) for every pair of k groups, e.g., k simulation scenarios.
+    Calling gen_large_sample_ci_diff_pop_mean for each of the k(k-1)/2 pairs checks, copies and computes the
+    variance of every sample k-1 times. Here each group's sample size, mean and variance are computed once, and
+    the k x k matrices of bounds are then built with broadcasting.
+
+    When many intervals are read together, the chance that at least one misses its difference is larger than
+    alpha. Optionally, the z value can be adjusted so the C = k(k-1)/2 intervals hold simultaneously with
+    probability at least the requested level: Bonferroni uses alpha / C for each interval and Sidak uses
+    1 - (1 - alpha)^(1/C).
+
+    Inputs:
+
+        samples (dictionary) = Maps each group name to its sample: a list of floats, a one dimensional NumPy array
+                               or Pandas Series of finite floats, or a LargeSampleCIAccumulator. Each sample size
+                               must be > 40 and at least 2 groups are needed.
+
+        approx_confidence_level (float) = The approximate confidence level desired for the confidence intervals
+                                          expressed as a percentage. For example, if you want 95% confidence
+                                          intervals, provide 95.0. A list of levels can be given to get the
+                                          matrices for each level from the same group statistics.
+
+        adjustment (string) = (Optional) None (no adjustment), 'bonferroni' or 'sidak'. Defaults to None
+
+    Outputs:
+
+        out_lst (list) = A list of three k x k Pandas DataFrames indexed (rows and columns) by the group names in
+                         the order of samples. At row i and column j, index 0 holds the CI lower bound for
+                         mu_i - mu_j, index 1 holds the sample mean of i minus the sample mean of j, and index 2
+                         holds the CI upper bound. On the diagonal the difference is 0.0 and the bounds are NaN.
+                         If approx_confidence_level is a list, a list holding one such list per level, in the
+                         same order.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_large_sample_ci_diff_pop_mean_pairwise.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Check for Input Errors -----------------------------
+    # samples needs to be a dictionary of at least 2 groups
+    if not (isinstance(samples,dict) and len(samples) >= 2):
+        raise Exception("samples needs to be a dictionary with at least 2 groups")
+
+    # approx_confidence_level needs to be a float (or a non-empty list of floats)
+    if isinstance(approx_confidence_level,list):
+        if not (len(approx_confidence_level) > 0 and all(isinstance(i,float) for i in approx_confidence_level)):
+            raise Exception("approx_confidence_level needs to be a float or a non-empty list of floats")
+    elif not isinstance(approx_confidence_level,float):
+        raise Exception("approx_confidence_level needs to be a float")
+
+    # adjustment needs to be None, 'bonferroni' or 'sidak'
+    if not adjustment in [None, 'bonferroni', 'sidak']:
+        raise Exception("adjustment needs to be None, 'bonferroni' or 'sidak'")
+
+    # Sample size, mean and variance of each group, computed once
+    k = len(samples)
+    n_arr = np.empty(k)
+    mean_arr = np.empty(k)
+    var_arr = np.empty(k)
+    for i, (name, sample) in enumerate(samples.items()):
+
+        if isinstance(sample, LargeSampleCIAccumulator):
+            n_arr[i] = sample.n
+            mean_arr[i] = sample.mean
+            var_arr[i] = sample.sq_devs/float(sample.n - 1) if sample.n > 1 else np.nan
+
+        else:
+            # Each sample needs to be a list, NumPy array or Pandas Series of finite floats
+            if isinstance(sample,list):
+                if not all(isinstance(j,float) for j in sample):
+                    raise Exception("Each entry in the sample for group {} needs to be a float".format(name))
+                sample_arr = np.array(sample, dtype = 'float64')
+            elif isinstance(sample,(np.ndarray, pd.Series)):
+                sample_arr = np.asarray(sample)
+                if not (sample_arr.ndim == 1 and np.issubdtype(sample_arr.dtype, np.floating)):
+                    raise Exception("Each entry in the sample for group {} needs to be a float".format(name))
+            else:
+                raise Exception("The sample for group {} needs to be a list, NumPy array, Pandas Series or "
+                                "LargeSampleCIAccumulator".format(name))
+            if not np.isfinite(sample_arr).all():
+                raise Exception("The sample for group {} needs to hold finite values".format(name))
+
+            n_arr[i] = len(sample_arr)
+            mean_arr[i] = sample_arr.mean(dtype = 'float64')
+            var_arr[i] = sample_arr.var(ddof = 1, dtype = 'float64') if len(sample_arr) > 1 else np.nan
+
+        # The sample size for each group needs to be > 40
+        if not n_arr[i] > 40:
+            raise Exception("The sample size for group {} needs to be > 40".format(name))
+    #------------------ End Check for Input Errors -------------------------
+
+    # Every pair at once: row i minus column j
+    diff_mat = mean_arr[:, None] - mean_arr[None, :]
+    std_err_sq = var_arr / n_arr
+    std_err_mat = np.sqrt(std_err_sq[:, None] + std_err_sq[None, :])
+    np.fill_diagonal(std_err_mat, np.nan)
+    labels = list(samples.keys())
+    num_pairs = (k * (k - 1)) / 2.0
+
+    # One set of matrices per level from the same group statistics
+    if isinstance(approx_confidence_level,list):
+        level_lst = approx_confidence_level
+    else:
+        level_lst = [approx_confidence_level]
+
+    out_lst = []
+    for cur_level in level_lst:
+
+        # Compute the level for each interval, adjusted for the number of pairs if requested
+        alpha = 1.0 - (cur_level/100.0)
+        if adjustment == 'bonferroni':
+            cur_level = 100.0 * (1.0 - (alpha / num_pairs))
+        elif adjustment == 'sidak':
+            cur_level = 100.0 * ((1.0 - alpha) ** (1.0 / num_pairs))
+
+        # Get z value
+        half_width = gen_z_value(cur_level) * std_err_mat
+
+        # Return the bounds labeled by group
+        out_lst.append([df(diff_mat - half_width, index = labels, columns = labels),
+                        df(diff_mat, index = labels, columns = labels),
+                        df(diff_mat + half_width, index = labels, columns = labels)])
+
+    if isinstance(approx_confidence_level,list):
+        return out_lst
+    else:
+        return out_lst[0]
@@ -4,14 +4,17 @@
 
 #------------ Define Imports -----------
 import pandas as pd
-import copy
+import numpy as np
 import math
-from scipy.stats import norm
 #---------------------------------------
 
+#--------------- Import user defined functions -------------
+from gen_z_value import gen_z_value
+#-----------------------------------------------------------
+
 def gen_large_sample_ci_pop_mean(
-        sample: list,
-        approx_confidence_level_pct: float) -> list:
+        sample,
+        approx_confidence_level_pct) -> list:
 
     """
     Description:
@@ -24,22 +27,33 @@ def gen_large_sample_ci_pop_mean(
     distributed (IID) from the population for which the population mean is being estimated. The function also takes in
     the approximate confidence level for the confidence interval as a percentage float.
 
+    For large samples, sample can instead be a one dimensional NumPy array, a Pandas Series, or any other object
+    supporting the buffer protocol (e.g., array.array, memoryview) with a float dtype. These are read in place
+    without copying: the dtype is checked once, finiteness is checked and the mean and variance are computed with
+    vectorized NumPy operations over blocks of the array, accumulating in float64, so the extra memory used is one
+    block rather than a copy of the sample. Lists are handled exactly as before and return identical results.
+
     The function returns a list with 3 entries. The index 0 entry is the lower bound of the confidence interval. The 
     index 1 entry is the mean of the sample. The index 2 entry is the upper bound of the confidence interval.
 
     Inputs:
 
         sample (list) =  A list of floats where each value is an IID draw from the population for which the population 
-                         mean will be estimated by the confidence interval. The sample size must be > 40.
+                         mean will be estimated by the confidence interval. The sample size must be > 40. A one
+                         dimensional NumPy array, Pandas Series or buffer-protocol object of finite floats can be
+                         given instead.
 
         approx_confidence_level_pct (float) = The approximate confidence level desired for the confidence interval
                                               expressed as a percentage. For example, if you want a 95% confidence 
-                                              interval, provide 95.0.
+                                              interval, provide 95.0. A list of levels (e.g., [90.0, 95.0, 99.0])
+                                              can be given to get an interval for each level from one pass over
+                                              the sample.
         
     Outputs:
 
         out_lst (list)  =  A list where index 0 is the CI lower bound, index 1 is the sampe mean, and index 2 is the CI
-                           upper bound.
+                           upper bound. If approx_confidence_level_pct is a list, a list holding one such list per
+                           level, in the same order.
 
     Testing:
 
@@ -51,17 +65,23 @@ def gen_large_sample_ci_pop_mean(
     """
 
     #------------------ Check User Inputs ---------------------
-    # Sample must be a list
-    if not isinstance(sample,list):
-        raise Exception("sample needs to be a list")
-    
+    # Sample must be a list, or an array-like read in place (which also checks its values)
+    if isinstance(sample,list):
+        sample_arr = None
+    else:
+        sample_arr = _as_float_array(sample)
+
     # Sample must contain floats
-    for i in sample:
-        if not isinstance(i,float):
-            raise Exception("sample must contain all floats")
+    if sample_arr is None:
+        for i in sample:
+            if not isinstance(i,float):
+                raise Exception("sample must contain all floats")
     
-    # approx_confidence_level_pct must be a float
-    if not isinstance(approx_confidence_level_pct,float):
+    # approx_confidence_level_pct must be a float (or a non-empty list of floats)
+    if isinstance(approx_confidence_level_pct,list):
+        if not (len(approx_confidence_level_pct) > 0 and all(isinstance(i,float) for i in approx_confidence_level_pct)):
+            raise Exception("approx_confidence_level_pct must be a float or a non-empty list of floats")
+    elif not isinstance(approx_confidence_level_pct,float):
         raise Exception("approx_confidence_level_pct must be a float")
     
     # The sample size must be > 40 (per Devore p. 286)
@@ -69,28 +89,101 @@ def gen_large_sample_ci_pop_mean(
         raise Exception("For this confidence interval, the sample size must be greater than 40")
     #----------------------------------------------------------
 
-    # Copy input list
-    wrk_sample = copy.deepcopy(sample)
+    # The sample is only read, so it is used without a working copy
+    wrk_sample = sample
 
-    # Compute alpha from approx_confidence_level_pct
-    alpha = 1.0 - (approx_confidence_level_pct/100.0)
+    if sample_arr is None:
 
-    # Compute sample mean
-    sample_mean = float(sum(wrk_sample))/float(len(wrk_sample))
+        # Compute sample mean
+        sample_mean = float(sum(wrk_sample))/float(len(wrk_sample))
+
+        # Compute sample standard deviation
+        run_total = 0.0
+        for i in wrk_sample:
+            run_total = run_total + (i - sample_mean)**2
+        sample_var = run_total/float((len(wrk_sample)-1))
+
+    else:
+
+        # Compute sample mean and variance block by block
+        sample_mean, sample_var = _block_mean_var(sample_arr)
 
-    # Compute sample standard deviation
-    run_total = 0.0
-    for i in wrk_sample:
-        run_total = run_total + (i - sample_mean)**2
-    sample_var = run_total/float((len(wrk_sample)-1))
     sample_st_dev = float(math.sqrt(sample_var))
 
-    # Get z value
-    z = float(norm.ppf(1.0 - (alpha/2.0)))
+    # One interval per level from the same sample statistics
+    if isinstance(approx_confidence_level_pct,list):
+        level_lst = approx_confidence_level_pct
+    else:
+        level_lst = [approx_confidence_level_pct]
 
-    # Compute CI lower and upper bound
-    ci_lower_bnd = sample_mean - (z * (sample_st_dev/math.sqrt(float(len(wrk_sample)))))
-    ci_upper_bnd = sample_mean + (z * (sample_st_dev/math.sqrt(float(len(wrk_sample)))))
+    out_lst = []
+    for cur_level in level_lst:
+
+        # Get z value (from the cache after the first call for a level)
+        z = gen_z_value(cur_level)
+
+        # Compute CI lower and upper bound
+        ci_lower_bnd = sample_mean - (z * (sample_st_dev/math.sqrt(float(len(wrk_sample)))))
+        ci_upper_bnd = sample_mean + (z * (sample_st_dev/math.sqrt(float(len(wrk_sample)))))
+        out_lst.append([ci_lower_bnd, sample_mean, ci_upper_bnd])
 
     # Return statement
-    return [ci_lower_bnd, sample_mean, ci_upper_bnd]
+    if isinstance(approx_confidence_level_pct,list):
+        return out_lst
+    else:
+        return out_lst[0]
+
+
+def _as_float_array(sample, block_size: int = 1048576) -> np.ndarray:
+
+    """
+    Returns a one dimensional float NumPy view of a NumPy array, Pandas Series or buffer-protocol object without
+    copying it, raising the user input errors of gen_large_sample_ci_pop_mean otherwise. Finiteness is checked over
+    blocks of block_size values.
+    """
+
+    # Pandas Series give their underlying array; everything else needs to expose a buffer
+    if isinstance(sample,pd.Series):
+        sample_arr = sample.to_numpy()
+    elif isinstance(sample,np.ndarray):
+        sample_arr = sample
+    else:
+        try:
+            sample_arr = np.asarray(memoryview(sample))
+        except TypeError:
+            raise Exception("sample needs to be a list, NumPy array, Pandas Series or buffer-protocol object")
+
+    # One dtype check in place of checking every entry
+    if not (sample_arr.ndim == 1 and np.issubdtype(sample_arr.dtype, np.floating)):
+        raise Exception("sample must contain all floats")
+
+    # Every value needs to be finite
+    for start in range(0, len(sample_arr), block_size):
+        if not np.isfinite(sample_arr[start:start + block_size]).all():
+            raise Exception("sample must contain all finite floats")
+
+    return sample_arr
+
+
+def _block_mean_var(sample_arr: np.ndarray, block_size: int = 1048576) -> list:
+
+    """
+    Returns [mean, sample variance (n-1 denominator)] of a float array, accumulated in float64 over blocks of
+    block_size values so the temporary arrays never exceed one block.
+    """
+
+    n = len(sample_arr)
+
+    # Mean from block sums
+    run_total = 0.0
+    for start in range(0, n, block_size):
+        run_total = run_total + float(np.sum(sample_arr[start:start + block_size], dtype = 'float64'))
+    sample_mean = run_total/float(n)
+
+    # Sum of squared deviations from the mean (two-pass)
+    run_total = 0.0
+    for start in range(0, n, block_size):
+        block_dev = sample_arr[start:start + block_size].astype('float64') - sample_mean
+        run_total = run_total + float(np.dot(block_dev, block_dev))
+
+    return [sample_mean, run_total/float(n - 1)]
@@ -0,0 +1,157 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+import math
+from concurrent.futures import ProcessPoolExecutor
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from large_sample_ci_accumulator import LargeSampleCIAccumulator
+#-----------------------------------------------------------
+
+def gen_sequential_ci_pop_mean(
+        sample_func,
+        approx_confidence_level_pct: float,
+        target_half_width: float = None,
+        target_rel_precision: float = None,
+        initial_n: int = 41,
+        batch_size: int = 10,
+        max_n: int = 10000,
+        max_workers: int = 1) -> list:
+
+    """
+    Description:
+
+    This function runs simulation replications until the large-sample confidence interval for the population
+    mean of gen_large_sample_ci_pop_mean (Devore p.286) is as precise as requested, rather than running a fixed
+    number of replications chosen in advance. It follows the sequential procedures of "Simulation Modeling and
+    Analysis: 6th Edition" by Averill M. Law (section 9.4.1): make initial_n replications, then keep adding
+    batches of batch_size replications until the interval's half width meets the target or max_n replications
+    have been made.
+
+    Two targets are supported (at least one is needed; if both are given, the procedure stops when either is
+    met):
+
+        target_half_width = Absolute precision. Stops when the half width is <= target_half_width.
+
+        target_rel_precision = Relative precision gamma. Stops when the half width divided by the absolute
+                               sample mean is <= gamma / (1 + gamma), which gives an actual relative error of at
+                               most gamma (the adjusted relative precision of Law section 9.4.1).
+
+    Each replication is made by calling sample_func(rep_index) with rep_index = 1, 2, ..., which returns that
+    replication's output. The replication number should be used to set the replication's random number seed,
+    so a run is reproducible no matter how the replications are split across processes. With max_workers > 1,
+    each batch of replications is run across a pool of worker processes (sample_func then needs to be a module
+    level function so it can be pickled). Replications are added to a LargeSampleCIAccumulator as each batch
+    finishes, so every check of the interval is O(batch_size) rather than a pass over all replications.
+
+    Inputs:
+
+        sample_func (function) = Function taking the replication number (int) and returning the replication's
+                                 output (float).
+
+        approx_confidence_level_pct (float) = The approximate confidence level desired for the confidence interval
+                                              expressed as a percentage. For example, if you want a 95% confidence
+                                              interval, provide 95.0.
+
+        target_half_width (float) = (Optional) The target half width, > 0. Defaults to None
+
+        target_rel_precision (float) = (Optional) The target relative precision gamma, > 0. Defaults to None
+
+        initial_n (int) = (Optional) Number of replications made before the first check. Needs to be > 40.
+                          Defaults to 41
+
+        batch_size (int) = (Optional) Number of replications added between checks. Defaults to 10
+
+        max_n (int) = (Optional) Largest number of replications made, >= initial_n. Defaults to 10000
+
+        max_workers (int) = (Optional) Number of worker processes. With 1 (the default) the replications are run
+                            in the calling process.
+
+    Outputs:
+
+        out_lst (list) = A list where index 0 is [CI lower bound, sample mean, CI upper bound] as returned by
+                         gen_large_sample_ci_pop_mean for the replications made, index 1 is the list of
+                         replication outputs in replication order, and index 2 is True if the target was met
+                         (False if the procedure stopped at max_n).
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_sequential_ci_pop_mean.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    #------------------ Check User Inputs ---------------------
+    # sample_func needs to be callable
+    if not callable(sample_func):
+        raise Exception('sample_func needs to be a function')
+
+    # approx_confidence_level_pct must be a float
+    if not isinstance(approx_confidence_level_pct,float):
+        raise Exception("approx_confidence_level_pct must be a float")
+
+    # At least one target is needed, each a positive float
+    if target_half_width is None and target_rel_precision is None:
+        raise Exception('target_half_width or target_rel_precision needs to be provided')
+    for target_name, target in [('target_half_width', target_half_width),
+                                ('target_rel_precision', target_rel_precision)]:
+        if not (target is None or (isinstance(target,float) and target > 0.0)):
+            raise Exception('{} needs to be a positive float if provided'.format(target_name))
+
+    # initial_n must be > 40 (per Devore p. 286)
+    if not (isinstance(initial_n,int) and initial_n > 40):
+        raise Exception('initial_n needs to be an int greater than 40')
+
+    # batch_size and max_workers need to be positive ints
+    if not (isinstance(batch_size,int) and batch_size > 0):
+        raise Exception('batch_size needs to be a positive int')
+    if not (isinstance(max_workers,int) and max_workers > 0):
+        raise Exception('max_workers needs to be a positive int')
+
+    # max_n needs to be at least initial_n
+    if not (isinstance(max_n,int) and max_n >= initial_n):
+        raise Exception('max_n needs to be an int of at least initial_n')
+    #----------------------------------------------------------
+
+    acc = LargeSampleCIAccumulator()
+    value_lst = []
+
+    # Run the initial replications, then one batch at a time until a target is met or max_n is reached
+    executor = ProcessPoolExecutor(max_workers = max_workers) if max_workers > 1 else None
+    try:
+        next_n = initial_n
+        while True:
+            rep_range = range(len(value_lst) + 1, next_n + 1)
+            if executor is None:
+                batch_lst = [sample_func(i) for i in rep_range]
+            else:
+                batch_lst = list(executor.map(sample_func, rep_range,
+                                              chunksize = max(1, len(rep_range) // (4 * max_workers))))
+
+            # Each replication needs to return a finite number
+            for i in batch_lst:
+                if not (isinstance(i,(int, float, np.number)) and not isinstance(i,bool) and math.isfinite(i)):
+                    raise Exception('sample_func needs to return a finite float')
+            value_lst.extend(float(i) for i in batch_lst)
+            acc.add(batch_lst)
+
+            # Check the precision of the interval
+            ci_lst = acc.gen_ci(approx_confidence_level_pct)
+            half_width = (ci_lst[2] - ci_lst[0]) / 2.0
+            target_met = ((target_half_width is not None and half_width <= target_half_width) or
+                          (target_rel_precision is not None and
+                           half_width <= (target_rel_precision / (1.0 + target_rel_precision)) * abs(ci_lst[1])))
+
+            if target_met or len(value_lst) >= max_n:
+                return [ci_lst, value_lst, target_met]
+
+            next_n = min(len(value_lst) + batch_size, max_n)
+    finally:
+        if executor is not None:
+            executor.shutdown()
@@ -0,0 +1,44 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+from functools import lru_cache
+from scipy.stats import norm
+#---------------------------------------
+
+@lru_cache(maxsize = 256)
+def gen_z_value(approx_confidence_level_pct: float) -> float:
+
+    """
+    Description:
+
+    This function returns the z value used by the large-sample confidence intervals in stats_utils (Devore
+    p.286), the 1 - alpha/2 quantile of the standard normal distribution where alpha = 1 - (level / 100). Results
+    are memoized, so after the first call for a level the value is returned from a cache instead of going through
+    scipy.stats.norm.ppf again. Reports typically use a handful of levels (e.g., 90.0, 95.0, 99.0) across very
+    many intervals, so nearly every call is a cache hit.
+
+    Inputs:
+
+        approx_confidence_level_pct (float) = The approximate confidence level expressed as a percentage. For
+                                              example, provide 95.0 for a 95% confidence interval.
+
+    Outputs:
+
+        z (float) = The z value for the confidence level.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_gen_z_value.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    # Compute alpha from approx_confidence_level_pct
+    alpha = 1.0 - (approx_confidence_level_pct/100.0)
+
+    # Get z value
+    return float(norm.ppf(1.0 - (alpha/2.0)))
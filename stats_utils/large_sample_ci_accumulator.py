@@ -0,0 +1,237 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+#------------ Define Imports -----------
+import numpy as np
+import math
+#---------------------------------------
+
+#--------------- Import user defined functions -------------
+from gen_z_value import gen_z_value
+#-----------------------------------------------------------
+
+class LargeSampleCIAccumulator:
+
+    """
+    Description:
+
+    The purpose of this class is to compute the large-sample confidence intervals of
+    gen_large_sample_ci_pop_mean (Devore p.286) and gen_large_sample_ci_diff_pop_mean (Devore p.369) for
+    samples that never fit in memory, such as samples read from files in chunks or produced by many worker
+    processes. Instead of holding the sample, the accumulator keeps the sample size, the running mean and the
+    running sum of squared deviations from the mean. Memory use is O(1) in the sample size.
+
+    Values are added in chunks of any size with add. Each chunk's size, mean and squared deviations are computed
+    with vectorized NumPy operations in float64 and combined with the running values by the update of Chan et
+    al. (for a chunk of one value this is exactly Welford's update). Accumulators filled separately (e.g., one per
+    file or per process; accumulators can be pickled) are combined with merge using the same formula, so the work
+    can be split across processes or machines in any way.
+
+    Inputs:
+
+        None
+
+    Attributes:
+
+        n (int) = The number of values added so far
+
+        mean (float) = The running sample mean (0.0 before any values are added)
+
+        sq_devs (float) = The running sum of squared deviations from the sample mean
+
+    Methods:
+
+        add(values) = Adds a float, or a chunk (list, NumPy array or Pandas Series of finite int or float
+                      values), to the running values.
+
+        merge(other) = Adds the running values of another LargeSampleCIAccumulator into this accumulator.
+
+        add_stats(n, mean, var) = Adds a sample known only by its size, mean and sample variance (n-1
+                                  denominator), e.g., from a report or a database aggregate.
+
+        add_sums(n, x_sum, x_sum_sq, shift = 0.0) = Adds a sample known only by its size, sum and sum of squares
+                                  (e.g., COUNT(x), SUM(x), SUM(x*x) from SQL). If the sums are of x - shift
+                                  instead of x, provide shift. The squared deviations are x_sum_sq - x_sum^2 / n,
+                                  which loses precision when the mean is large relative to the spread, so
+                                  shifting by a value near the mean (any one sample value will do) is
+                                  recommended.
+
+        get_var() = Returns the sample variance (n-1 denominator).
+
+        gen_ci(approx_confidence_level_pct) = Returns [CI lower bound, sample mean, CI upper bound] as
+                                              gen_large_sample_ci_pop_mean does (one list per level if a list
+                                              of levels is given). Needs n > 40.
+
+        gen_diff_ci(y_acc, approx_confidence_level) = Returns [CI lower bound, x mean minus y mean, CI upper
+                                                      bound] as gen_large_sample_ci_diff_pop_mean does, with
+                                                      this accumulator holding the x_sample and the
+                                                      LargeSampleCIAccumulator y_acc holding the y_sample
+                                                      (one list per level if a list of levels is given). Both
+                                                      need n > 40.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_large_sample_ci_accumulator.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    """
+
+    def __init__(self):
+
+        self.n = 0
+        self.mean = 0.0
+        self.sq_devs = 0.0
+
+    def add(self, values) -> None:
+
+        # Convert to a 1-D float64 array without copying when possible
+        try:
+            wrk_values = np.asarray(values, dtype = 'float64')
+        except (TypeError, ValueError):
+            raise Exception('values needs to hold int or float values')
+
+        # values needs to be a single value or one dimensional
+        if not wrk_values.ndim <= 1:
+            raise Exception('values needs to be a single value or one dimensional')
+        wrk_values = wrk_values.reshape(-1)
+
+        # values needs to be fully populated
+        if not np.isfinite(wrk_values).all():
+            raise Exception('values needs to be fully populated with finite values')
+
+        # Nothing to add for an empty chunk
+        if len(wrk_values) == 0:
+            return
+
+        # Size, mean and squared deviations of the chunk, then combine with the running values
+        chunk_mean = float(wrk_values.mean())
+        chunk_devs = wrk_values - chunk_mean
+        self._combine(len(wrk_values), chunk_mean, float(np.dot(chunk_devs, chunk_devs)))
+
+    def merge(self, other) -> None:
+
+        # other needs to be a LargeSampleCIAccumulator
+        if not isinstance(other, LargeSampleCIAccumulator):
+            raise Exception('other needs to be a LargeSampleCIAccumulator')
+
+        if other.n > 0:
+            self._combine(other.n, other.mean, other.sq_devs)
+
+    def add_stats(self, n: int, mean: float, var: float) -> None:
+
+        # n needs to be a positive int
+        if not (isinstance(n,int) and n > 0):
+            raise Exception('n needs to be a positive int')
+
+        # mean and var need to be finite floats, var non-negative (and only NaN-free for n > 1)
+        if not (isinstance(mean,float) and math.isfinite(mean)):
+            raise Exception('mean needs to be a finite float')
+        if n > 1 and not (isinstance(var,float) and math.isfinite(var) and var >= 0.0):
+            raise Exception('var needs to be a non-negative float')
+
+        if n > 1:
+            self._combine(n, mean, var * float(n - 1))
+        else:
+            self._combine(n, mean, 0.0)
+
+    def add_sums(self, n: int, x_sum: float, x_sum_sq: float, shift: float = 0.0) -> None:
+
+        # n needs to be a positive int
+        if not (isinstance(n,int) and n > 0):
+            raise Exception('n needs to be a positive int')
+
+        # x_sum, x_sum_sq and shift need to be finite numbers
+        for val_name, val in [('x_sum', x_sum), ('x_sum_sq', x_sum_sq), ('shift', shift)]:
+            if not (isinstance(val,(int, float)) and math.isfinite(val)):
+                raise Exception('{} needs to be a finite float'.format(val_name))
+
+        # Mean and squared deviations from the sums (rounding can leave a tiny negative value)
+        shifted_mean = float(x_sum) / float(n)
+        sq_devs = max(float(x_sum_sq) - (float(x_sum) * shifted_mean), 0.0)
+        self._combine(n, float(shift) + shifted_mean, sq_devs)
+
+    def _combine(self, other_n: int, other_mean: float, other_sq_devs: float) -> None:
+
+        # Chan et al. parallel update of the size, mean and squared deviations
+        total_n = self.n + other_n
+        delta = other_mean - self.mean
+        self.mean = self.mean + (delta * (other_n / total_n))
+        self.sq_devs = self.sq_devs + other_sq_devs + ((delta ** 2) * ((self.n * other_n) / total_n))
+        self.n = total_n
+
+    def get_var(self) -> float:
+
+        # At least two values are needed for a sample variance
+        if not self.n > 1:
+            raise Exception('At least 2 values need to be added')
+
+        return self.sq_devs/float(self.n - 1)
+
+    def gen_ci(self, approx_confidence_level_pct) -> list:
+
+        # approx_confidence_level_pct must be a float (or a non-empty list of floats)
+        if isinstance(approx_confidence_level_pct,list):
+            if not (len(approx_confidence_level_pct) > 0 and
+                    all(isinstance(i,float) for i in approx_confidence_level_pct)):
+                raise Exception("approx_confidence_level_pct must be a float or a non-empty list of floats")
+        elif not isinstance(approx_confidence_level_pct,float):
+            raise Exception("approx_confidence_level_pct must be a float")
+
+        # The sample size must be > 40 (per Devore p. 286)
+        if not self.n > 40:
+            raise Exception("For this confidence interval, the sample size must be greater than 40")
+
+        # Compute CI lower and upper bound for each level
+        std_err = math.sqrt(self.get_var())/math.sqrt(float(self.n))
+        out_lst = [[self.mean - (gen_z_value(i) * std_err), self.mean, self.mean + (gen_z_value(i) * std_err)]
+                   for i in _level_lst(approx_confidence_level_pct)]
+
+        if isinstance(approx_confidence_level_pct,list):
+            return out_lst
+        else:
+            return out_lst[0]
+
+    def gen_diff_ci(self, y_acc, approx_confidence_level) -> list:
+
+        # y_acc needs to be a LargeSampleCIAccumulator
+        if not isinstance(y_acc, LargeSampleCIAccumulator):
+            raise Exception('y_acc needs to be a LargeSampleCIAccumulator')
+
+        # The sample sizes need to be > 40
+        if not self.n > 40:
+            raise Exception("The sample size for x_sample needs to be > 40")
+        if not y_acc.n > 40:
+            raise Exception("The sample size for y_sample needs to be > 40")
+
+        # approx_confidence_level needs to be a float (or a non-empty list of floats)
+        if isinstance(approx_confidence_level,list):
+            if not (len(approx_confidence_level) > 0 and all(isinstance(i,float) for i in approx_confidence_level)):
+                raise Exception("approx_confidence_level needs to be a float or a non-empty list of floats")
+        elif not isinstance(approx_confidence_level,float):
+            raise Exception("approx_confidence_level needs to be a float")
+
+        # Compute CI lower and upper bound for each level
+        mean_diff = float(self.mean - y_acc.mean)
+        std_err = float(math.sqrt((self.get_var()/float(self.n)) + (y_acc.get_var()/float(y_acc.n))))
+        out_lst = [[mean_diff - (gen_z_value(i) * std_err), mean_diff, mean_diff + (gen_z_value(i) * std_err)]
+                   for i in _level_lst(approx_confidence_level)]
+
+        if isinstance(approx_confidence_level,list):
+            return out_lst
+        else:
+            return out_lst[0]
+
+
+def _level_lst(approx_confidence_level) -> list:
+
+    """
+    Returns the confidence level(s) as a list.
+    """
+
+    if isinstance(approx_confidence_level,list):
+        return approx_confidence_level
+    else:
+        return [approx_confidence_level]
@@ -0,0 +1,39 @@
+# **************************************
+# Function written by Nathan Jones
+# **************************************
+
+def quote_sqlite_ident(name: str) -> str:
+    '''
+    Description:
+
+    This function quotes a table or column name for use in a SQLite statement. The name is wrapped in double
+    quotes and any double quote within it is doubled, so names holding spaces, quotes or SQL keywords can be
+    placed into a statement safely.
+
+    graph_utils and stats_utils each hold an identical copy of this file, so the SQLite functions of either
+    directory only need that directory on sys.path.
+
+    Inputs:
+
+        name (string) = The table or column name.
+
+    Outputs:
+
+        out_str (string) = The quoted name, e.g., 'time"step' becomes '"time""step"'.
+
+    Testing:
+
+        Is all the testing for this function automated with pytest (Y/N): Y
+        Path to automated testing file for pytest: tests/test_quote_sqlite_ident.py
+        Date function initially passed pytest testing: 10/17/2026
+        Date non-pytest testing initially passed: N/A
+        Non-pytest testing description and result: N/A
+    '''
+
+    #------------ Confirm user input datatypes ----------------
+    # name needs to be a string
+    if not isinstance(name,str):
+        raise Exception("name needs to be a string")
+    #-----------------------------------------------------------
+
+    return '"{}"'.format(name.replace('"', '""'))